@@ -3,9 +3,17 @@ Data generation logic for ski resort telemetry.
 """
 import json
 import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Deque, List, Optional, Tuple
+
+import numpy as np
+import orjson
+from numba import njit
 
 from .models import (
     WeatherData,
@@ -17,6 +25,42 @@ from .models import (
 )
 
 
+# Lift status and slope difficulty are stored as small integer codes
+# indexing into these tuples.
+_LIFT_STATUSES = ("open", "closed", "maintenance")
+_LIFT_OPEN = 0
+_DIFFICULTIES = ("green", "blue", "red", "black")
+_RED = 2
+_BLACK = 3
+
+# Layout of the weather state array and of the tick parameter array.
+_TEMP, _WIND, _SNOW, _VIS = range(4)
+_WEATHER_LO = np.array([-15.0, 0.0, 0.0, 50.0])
+_WEATHER_HI = np.array([5.0, 80.0, 5.0, 10000.0])
+(_P_TEMP_D, _P_WIND_D, _P_SNOW_D, _P_VIS_D, _P_QUEUE_D, _P_STATUS_P,
+ _P_RISK_D, _P_DEPTH_D, _P_REOPEN_P, _P_GROOM_P, _P_UNGROOM_P) = range(11)
+# Layout of the per-tick uniform deltas: weather fields, risk, then one per slope.
+_D_RISK = 4
+_D_SLOPES = 5
+
+# Number of uniform(-1, 1) samples pre-drawn per refill of the random buffer
+_RAND_BUFFER_SIZE = 4096
+
+_BASE_INCIDENT_TYPES = ("minor_injury", "collision", "lost_person", "equipment_failure")
+# Higher avalanche risk increases avalanche warnings (listed twice for higher probability)
+_HIGH_RISK_INCIDENT_TYPES = _BASE_INCIDENT_TYPES + ("avalanche_warning", "avalanche_warning")
+# Incidents are kept as (incident_type, location, severity, epoch_seconds)
+_Incident = Tuple[str, str, str, float]
+
+_SEVERITY_MAP = {
+    "minor_injury": ("low", "medium"),
+    "collision": ("low", "medium", "high"),
+    "lost_person": ("medium", "high"),
+    "equipment_failure": ("low", "medium", "high"),
+    "avalanche_warning": ("high", "critical"),
+}
+
+
 def _load_config() -> dict:
     """Load configuration from config.json."""
     config_path = Path(__file__).parent / "config.json"
@@ -24,41 +68,159 @@ def _load_config() -> dict:
         return json.load(f)
 
 
+@njit(cache=True)
+def _round1(x):
+    """Round to one decimal, half-to-even on x * 10; may differ from round(x, 1) by 0.1."""
+    return np.rint(x * 10.0) / 10.0
+
+
+@njit(cache=True, nogil=True)
+def _tick(weather, risk, lift_queue, lift_status, lift_wait, lift_inv_throughput,
+          slope_depth, slope_open, slope_groomed, slope_diff, params,
+          deltas, queue_deltas, lift_coins, slope_coins):
+    """
+    Advance weather, lifts, avalanche risk and slopes by one step.
+    All randomness is pre-drawn by the caller: `deltas` holds the uniform
+    random-walk steps, `queue_deltas` the integer queue steps, and
+    `lift_coins` / `slope_coins` (3 rows: reopen, groom, ungroom) hold
+    uniform [0, 1) samples compared against the event probabilities.
+    Arrays are updated in place; returns the new avalanche risk index.
+    """
+    # Weather: gradual random walks. Heavy snow and strong wind also cut
+    # visibility; the thresholds lie inside the clamp ranges, so testing the
+    # unclamped values is equivalent and all four fields clamp in one pass.
+    step = deltas[:4].copy()
+    d = params[_P_VIS_D]
+    if weather[_SNOW] + step[_SNOW] > 2:
+        step[_VIS] -= d * 2
+    if weather[_WIND] + step[_WIND] > 40:
+        step[_VIS] -= d * 1.5
+    np.clip(weather + step, _WEATHER_LO, _WEATHER_HI, weather)
+
+    # Lifts
+    np.clip(lift_queue + queue_deltas, 0, 200, lift_queue)
+    status_p = params[_P_STATUS_P]
+    for i in np.nonzero(lift_coins < status_p)[0]:
+        if lift_status[i] == _LIFT_OPEN:
+            # The coin is uniform on [0, status_p) here; split it for closed vs maintenance
+            lift_status[i] = 1 if lift_coins[i] < status_p / 2 else 2
+        else:
+            lift_status[i] = _LIFT_OPEN
+    # Minutes per queued skier is precomputed (0 for lifts with no throughput)
+    lift_wait[:] = _round1(lift_queue * lift_inv_throughput * (lift_status == _LIFT_OPEN))
+
+    # Safety
+    d = params[_P_RISK_D]
+    risk_delta = deltas[_D_RISK]
+    if weather[_WIND] > 50:
+        risk_delta += d * 0.5
+    if weather[_SNOW] > 3:
+        risk_delta += d * 0.5
+    risk = max(0.0, min(1.0, risk + risk_delta))
+
+    # Slopes: depth random walk plus fresh snow, then open/groomed state as
+    # straight-line boolean mask expressions over all slopes
+    snow_bonus = weather[_SNOW] * 0.1 if weather[_SNOW] > 1 else 0.0
+    slope_depth[:] = _round1(np.maximum(slope_depth + deltas[_D_SLOPES:] + snow_bonus, 0.0))
+
+    closed = (((slope_diff == _BLACK) & (risk > 0.8))
+              | ((slope_diff >= _RED) & (weather[_WIND] > 60)))
+    slope_open[:] = ~closed & (slope_open | (slope_coins[0] < params[_P_REOPEN_P]))
+
+    groom = (slope_diff < _RED) & (slope_coins[1] < params[_P_GROOM_P])
+    slope_groomed[:] = groom | (slope_groomed & (slope_coins[2] >= params[_P_UNGROOM_P]))
+
+    return risk
+
+
+@dataclass(frozen=True, slots=True)
+class _Snapshot:
+    """Immutable copy of the tick state, published by swapping a single reference."""
+    version: int
+    current_time: float
+    weather: np.ndarray
+    risk: float
+    lift_queue: np.ndarray
+    lift_status: np.ndarray
+    lift_wait: np.ndarray
+    slope_depth: np.ndarray
+    slope_open: np.ndarray
+    slope_groomed: np.ndarray
+    incidents: Tuple[_Incident, ...]
+
+
 class DataGenerator:
     """Generates and evolves synthetic ski resort telemetry data."""
 
     def __init__(self):
         """Initialize the generator with realistic starting values."""
         self.config = _load_config()
-        self.current_time = datetime.now()
-        
+        # Epoch seconds; converted to datetime only when models are materialized
+        self.current_time = time.time()
+        self._rng = np.random.default_rng()
+        self._rand_buf = self._rng.uniform(-1, 1, size=_RAND_BUFFER_SIZE)
+        self._rand_idx = 0
+
+        # Pack tunables into one array so the update tick avoids dict lookups
+        cfg = self.config
+        self._params = np.array([
+            cfg["weather"]["temperature_drift"],
+            cfg["weather"]["wind_speed_drift"],
+            cfg["weather"]["snow_intensity_drift"],
+            cfg["weather"]["visibility_drift"],
+            cfg["lifts"]["queue_drift"],
+            cfg["lifts"]["status_change_probability"],
+            cfg["safety"]["risk_drift"],
+            cfg["slopes"]["depth_drift"],
+            cfg["slopes"]["reopen_probability"],
+            cfg["slopes"]["groom_probability"],
+            cfg["slopes"]["ungroom_probability"],
+        ], dtype=np.float64)
+        self._queue_d = int(self._params[_P_QUEUE_D])
+        self._s_incident_p = cfg["safety"]["incident_probability"]
+        self._interval_min = cfg["update_interval_seconds"]["min"]
+        self._interval_max = cfg["update_interval_seconds"]["max"]
+
         # Initialize lifts
-        self.lifts = self._create_initial_lifts()
-        
+        self._create_initial_lifts()
+
         # Initialize slopes
-        self.slopes = self._create_initial_slopes()
-        
-        # Initialize weather
-        self.weather = WeatherData(
-            temperature=random.uniform(-10, 0),
-            wind_speed=random.uniform(5, 25),
-            snow_intensity=random.uniform(0, 2),
-            visibility=random.uniform(5000, 10000),
-            timestamp=self.current_time,
-        )
-        
+        self._create_initial_slopes()
+
+        # Incident locations and id lookups never change after startup
+        self._locations = self._slope_names + self._lift_names
+        self._lift_by_id = {lift_id: i for i, lift_id in enumerate(self._lift_ids)}
+        self._slope_by_id = {slope_id: i for i, slope_id in enumerate(self._slope_ids)}
+
+        # Half-widths of every uniform delta drawn per tick (see _D_* layout)
+        p = self._params
+        self._drift_hi = np.concatenate((
+            p[[_P_TEMP_D, _P_WIND_D, _P_SNOW_D, _P_VIS_D, _P_RISK_D]],
+            np.full(len(self._slope_ids), p[_P_DEPTH_D]),
+        ))
+
+        # Initialize weather: [temperature, wind_speed, snow_intensity, visibility]
+        self._weather = self._rng.uniform([-10, 5, 0, 5000], [0, 25, 2, 10000])
+
         # Initialize safety
-        self.safety = SafetyData(
-            avalanche_risk_index=random.uniform(0.1, 0.4),
-            incident_reports=[],
-            timestamp=self.current_time,
-        )
-        
+        self._risk = float(self._rng.uniform(0.1, 0.4))
+
         # Keep track of recent incidents (last 20)
-        self._incident_history: List[IncidentReport] = []
+        self._incident_history: Deque[_Incident] = deque(maxlen=20)
+
+        # Serializes writers (update() runs on a worker thread). Readers never
+        # take it: they read the published _state reference, which is
+        # swapped atomically after each tick.
+        self._lock = threading.Lock()
+        self._version = 0
+        self._state = self._publish()
 
-    def _create_initial_lifts(self) -> List[LiftData]:
-        """Create initial lift configurations."""
+        # Materialized models, built at most once per published version
+        self._resort_state: Optional[Tuple[int, ResortState]] = None
+        self._resort_json: Optional[Tuple[int, bytes]] = None
+
+    def _create_initial_lifts(self) -> None:
+        """Create initial lift configurations as parallel arrays."""
         # Each lift serves specific slopes (defined in _create_initial_slopes)
         lift_configs = [
             ("gondola-1", "Summit Gondola", 2400, "open", ["summit-chute", "avalanche-alley"]),
@@ -67,27 +229,18 @@ class DataGenerator:
             ("t-bar-1", "Beginner T-Bar", 800, "open", ["valley-run"]),
             ("magic-carpet-1", "Kids Magic Carpet", 400, "open", ["sunrise-trail"]),
         ]
-        
-        lifts = []
-        for lift_id, name, throughput, status, serves_slopes in lift_configs:
-            queue = random.randint(10, 80)
-            wait_time = (queue / throughput) * 60 if throughput > 0 else 0
-            
-            lifts.append(LiftData(
-                lift_id=lift_id,
-                name=name,
-                status=status,
-                queue_length=queue,
-                wait_time_minutes=round(wait_time, 1),
-                throughput_rate=throughput,
-                serves_slopes=serves_slopes,
-                timestamp=self.current_time,
-            ))
-        
-        return lifts
-
-    def _create_initial_slopes(self) -> List[SlopeData]:
-        """Create initial slope configurations."""
+
+        self._lift_ids, self._lift_names, throughput, status, self._lift_serves = zip(*lift_configs)
+        self._lift_throughput = np.array(throughput, dtype=np.int32)
+        self._lift_status = np.array([_LIFT_STATUSES.index(s) for s in status], dtype=np.int8)
+        self._lift_queue = self._rng.integers(10, 81, size=len(lift_configs)).astype(np.int32)
+        self._lift_inv_throughput = np.where(
+            self._lift_throughput > 0, 60.0 / np.maximum(self._lift_throughput, 1), 0.0
+        )
+        self._lift_wait = (self._lift_queue * self._lift_inv_throughput).round(1)
+
+    def _create_initial_slopes(self) -> None:
+        """Create initial slope configurations as parallel arrays."""
         slope_configs = [
             ("valley-run", "Valley Run", "green", True, True, 85, "t-bar-1"),
             ("sunrise-trail", "Sunrise Trail", "green", True, True, 90, "magic-carpet-1"),
@@ -98,183 +251,230 @@ class DataGenerator:
             ("summit-chute", "Summit Chute", "black", True, False, 130, "gondola-1"),
             ("avalanche-alley", "Avalanche Alley", "black", True, False, 125, "gondola-1"),
         ]
-        
-        slopes = []
-        for slope_id, name, difficulty, is_open, groomed, base_depth, lift_id in slope_configs:
-            depth_variance = random.uniform(-10, 10)
-            
-            slopes.append(SlopeData(
-                slope_id=slope_id,
-                name=name,
-                difficulty=difficulty,
-                is_open=is_open,
-                groomed=groomed,
-                snow_depth_cm=round(base_depth + depth_variance, 1),
-                served_by_lift_id=lift_id,
-            ))
-        
-        return slopes
+
+        (self._slope_ids, self._slope_names, difficulty, is_open, groomed,
+         base_depth, self._slope_lift_ids) = zip(*slope_configs)
+        self._slope_diff = np.array([_DIFFICULTIES.index(d) for d in difficulty], dtype=np.int8)
+        self._slope_open = np.array(is_open, dtype=bool)
+        self._slope_groomed = np.array(groomed, dtype=bool)
+        depth_variance = self._rng.uniform(-10, 10, size=len(slope_configs))
+        self._slope_depth = (np.array(base_depth, dtype=np.float64) + depth_variance).round(1)
+
+    def _publish(self) -> _Snapshot:
+        """Copy the working arrays into a new immutable snapshot."""
+        return _Snapshot(
+            version=self._version,
+            current_time=self.current_time,
+            weather=self._weather.copy(),
+            risk=self._risk,
+            lift_queue=self._lift_queue.copy(),
+            lift_status=self._lift_status.copy(),
+            lift_wait=self._lift_wait.copy(),
+            slope_depth=self._slope_depth.copy(),
+            slope_open=self._slope_open.copy(),
+            slope_groomed=self._slope_groomed.copy(),
+            incidents=tuple(self._incident_history),
+        )
+
+    @property
+    def timestamp(self) -> datetime:
+        """Time of the last published update as a datetime."""
+        return datetime.fromtimestamp(self._state.current_time)
+
+    @property
+    def weather(self) -> WeatherData:
+        """Materialize the published weather as a WeatherData model."""
+        return self._build_weather(self._state)
+
+    @property
+    def safety(self) -> SafetyData:
+        """Materialize the published risk and incident history as a SafetyData model."""
+        return self._build_safety(self._state)
+
+    @property
+    def lifts(self) -> List[LiftData]:
+        """Materialize the published lift arrays as LiftData models."""
+        return self._build_lifts(self._state)
+
+    @property
+    def slopes(self) -> List[SlopeData]:
+        """Materialize the published slope arrays as SlopeData models."""
+        return self._build_slopes(self._state)
+
+    # The _build_* helpers use model_construct: the values come straight from
+    # the generator and are valid by construction, so validation is skipped.
+
+    def _build_weather(self, snap: _Snapshot) -> WeatherData:
+        """Build a WeatherData model from a snapshot."""
+        temperature, wind_speed, snow_intensity, visibility = snap.weather.tolist()
+        return WeatherData.model_construct(
+            temperature=temperature,
+            wind_speed=wind_speed,
+            snow_intensity=snow_intensity,
+            visibility=visibility,
+            timestamp=datetime.fromtimestamp(snap.current_time),
+        )
+
+    def _build_safety(self, snap: _Snapshot) -> SafetyData:
+        """Build a SafetyData model from a snapshot."""
+        return SafetyData.model_construct(
+            avalanche_risk_index=snap.risk,
+            incident_reports=[
+                IncidentReport.model_construct(
+                    incident_type=incident_type,
+                    location=location,
+                    severity=severity,
+                    timestamp=datetime.fromtimestamp(ts),
+                )
+                for incident_type, location, severity, ts in snap.incidents
+            ],
+            timestamp=datetime.fromtimestamp(snap.current_time),
+        )
+
+    def _build_lifts(self, snap: _Snapshot) -> List[LiftData]:
+        """Build LiftData models from a snapshot."""
+        timestamp = datetime.fromtimestamp(snap.current_time)
+        return [
+            LiftData.model_construct(
+                lift_id=self._lift_ids[i],
+                name=self._lift_names[i],
+                status=_LIFT_STATUSES[snap.lift_status[i]],
+                queue_length=int(snap.lift_queue[i]),
+                wait_time_minutes=float(snap.lift_wait[i]),
+                throughput_rate=int(self._lift_throughput[i]),
+                serves_slopes=list(self._lift_serves[i]),
+                timestamp=timestamp,
+            )
+            for i in range(len(self._lift_ids))
+        ]
+
+    def _build_slopes(self, snap: _Snapshot) -> List[SlopeData]:
+        """Build SlopeData models from a snapshot."""
+        return [
+            SlopeData.model_construct(
+                slope_id=self._slope_ids[i],
+                name=self._slope_names[i],
+                difficulty=_DIFFICULTIES[self._slope_diff[i]],
+                is_open=bool(snap.slope_open[i]),
+                groomed=bool(snap.slope_groomed[i]),
+                snow_depth_cm=float(snap.slope_depth[i]),
+                served_by_lift_id=self._slope_lift_ids[i],
+            )
+            for i in range(len(self._slope_ids))
+        ]
 
     def update(self) -> None:
         """
         Update all telemetry data with realistic changes.
         Called every 1-3 seconds to simulate real-time evolution.
+        Safe to call from a worker thread.
         """
-        self.current_time = datetime.now()
-        
-        # Update weather with gradual changes
-        self._update_weather()
-        
-        # Update lifts
-        self._update_lifts()
-        
-        # Update safety data
-        self._update_safety()
-        
-        # Update slopes based on conditions
-        self._update_slopes()
-
-    def _update_weather(self) -> None:
-        """Update weather conditions with gradual random walks."""
-        cfg = self.config["weather"]
-        d = cfg["temperature_drift"]
-        temp_delta = random.uniform(-d, d)
-        new_temp = self.weather.temperature + temp_delta
-        self.weather.temperature = max(-15, min(5, new_temp))
-        
-        d = cfg["wind_speed_drift"]
-        wind_delta = random.uniform(-d, d)
-        new_wind = self.weather.wind_speed + wind_delta
-        self.weather.wind_speed = max(0, min(80, new_wind))
-        
-        d = cfg["snow_intensity_drift"]
-        snow_delta = random.uniform(-d, d)
-        new_snow = self.weather.snow_intensity + snow_delta
-        self.weather.snow_intensity = max(0, min(5, new_snow))
-        
-        d = cfg["visibility_drift"]
-        vis_delta = random.uniform(-d, d)
-        if self.weather.snow_intensity > 2:
-            vis_delta -= d * 2
-        if self.weather.wind_speed > 40:
-            vis_delta -= d * 1.5
-        new_vis = self.weather.visibility + vis_delta
-        self.weather.visibility = max(50, min(10000, new_vis))
-        
-        self.weather.timestamp = self.current_time
-
-    def _update_lifts(self) -> None:
-        """Update lift operations."""
-        cfg = self.config["lifts"]
-        for lift in self.lifts:
-            d = cfg["queue_drift"]
-            queue_delta = random.randint(-d, d)
-            new_queue = lift.queue_length + queue_delta
-            lift.queue_length = max(0, min(200, new_queue))
-            
-            if random.random() < cfg["status_change_probability"]:
-                if lift.status == "open":
-                    lift.status = random.choice(["closed", "maintenance"])
-                else:
-                    lift.status = "open"
-            
-            if lift.status == "open" and lift.throughput_rate > 0:
-                lift.wait_time_minutes = round((lift.queue_length / lift.throughput_rate) * 60, 1)
-            else:
-                lift.wait_time_minutes = 0
-            
-            lift.timestamp = self.current_time
-
-    def _update_safety(self) -> None:
-        """Update safety metrics and generate occasional incidents."""
-        cfg = self.config["safety"]
-        d = cfg["risk_drift"]
-        risk_delta = random.uniform(-d, d)
-        
-        if self.weather.wind_speed > 50:
-            risk_delta += d * 0.5
-        if self.weather.snow_intensity > 3:
-            risk_delta += d * 0.5
-        
-        new_risk = self.safety.avalanche_risk_index + risk_delta
-        self.safety.avalanche_risk_index = max(0, min(1, new_risk))
-        
-        if random.random() < cfg["incident_probability"]:
-            incident = self._generate_incident()
-            self._incident_history.append(incident)
-            # Keep only last 20 incidents
-            self._incident_history = self._incident_history[-20:]
-        
-        self.safety.incident_reports = self._incident_history.copy()
-        self.safety.timestamp = self.current_time
-
-    def _generate_incident(self) -> IncidentReport:
+        n_lifts, n_slopes = len(self._lift_ids), len(self._slope_ids)
+        with self._lock:
+            self.current_time = time.time()
+
+            # One batch of [0, 1) coins per tick: lift status changes, slope
+            # reopen/groom/ungroom rows, and finally the incident roll
+            coins = self._rng.random(n_lifts + 3 * n_slopes + 1)
+            d = self._queue_d
+
+            # Weather, lifts, avalanche risk and slopes in one compiled step
+            self._risk = _tick(
+                self._weather, self._risk,
+                self._lift_queue, self._lift_status, self._lift_wait, self._lift_inv_throughput,
+                self._slope_depth, self._slope_open, self._slope_groomed, self._slope_diff,
+                self._params,
+                self._draw(len(self._drift_hi)) * self._drift_hi,
+                self._rng.integers(-d, d + 1, size=n_lifts, dtype=np.int32),
+                coins[:n_lifts],
+                coins[n_lifts:-1].reshape(3, n_slopes),
+            )
+
+            # Incidents carry strings, so they stay on the Python side
+            if coins[-1] < self._s_incident_p:
+                self._incident_history.append(self._generate_incident())
+
+            self._version += 1
+            self._state = self._publish()
+
+    def _draw(self, n: int) -> np.ndarray:
+        """Take the next n uniform(-1, 1) samples, refilling the buffer when exhausted."""
+        if self._rand_idx + n > len(self._rand_buf):
+            self._rand_buf = self._rng.uniform(-1, 1, size=_RAND_BUFFER_SIZE)
+            self._rand_idx = 0
+        start = self._rand_idx
+        self._rand_idx += n
+        return self._rand_buf[start:self._rand_idx]
+
+    def next_interval(self) -> float:
+        """Seconds until the next update, drawn from the configured interval range."""
+        with self._lock:
+            u = (self._draw(1)[0] + 1) / 2
+        return self._interval_min + u * (self._interval_max - self._interval_min)
+
+    def _generate_incident(self) -> _Incident:
         """Generate a random incident report."""
-        incident_types = ["minor_injury", "collision", "lost_person", "equipment_failure"]
-        
-        # Higher avalanche risk increases avalanche warnings
-        if self.safety.avalanche_risk_index > 0.7:
-            incident_types.append("avalanche_warning")
-            incident_types.append("avalanche_warning")  # Higher probability
-        
+        incident_types = _HIGH_RISK_INCIDENT_TYPES if self._risk > 0.7 else _BASE_INCIDENT_TYPES
         incident_type = random.choice(incident_types)
-        
+
         # Determine severity based on type
-        severity_map = {
-            "minor_injury": ["low", "medium"],
-            "collision": ["low", "medium", "high"],
-            "lost_person": ["medium", "high"],
-            "equipment_failure": ["low", "medium", "high"],
-            "avalanche_warning": ["high", "critical"],
-        }
-        
-        severity = random.choice(severity_map[incident_type])
-        
+        severity = random.choice(_SEVERITY_MAP[incident_type])
+
         # Random location from slopes and lifts
-        locations = [slope.name for slope in self.slopes] + [lift.name for lift in self.lifts]
-        location = random.choice(locations)
-        
-        return IncidentReport(
-            incident_type=incident_type,
-            location=location,
-            severity=severity,
-            timestamp=self.current_time,
-        )
+        location = random.choice(self._locations)
 
-    def _update_slopes(self) -> None:
-        """Update slope conditions based on weather and safety."""
-        cfg = self.config["slopes"]
-        for slope in self.slopes:
-            d = cfg["depth_drift"]
-            depth_delta = random.uniform(-d, d)
-            if self.weather.snow_intensity > 1:
-                depth_delta += self.weather.snow_intensity * 0.1
-            
-            new_depth = slope.snow_depth_cm + depth_delta
-            slope.snow_depth_cm = round(max(0, new_depth), 1)
-            
-            if slope.difficulty == "black" and self.safety.avalanche_risk_index > 0.8:
-                slope.is_open = False
-            
-            if slope.difficulty in ["black", "red"] and self.weather.wind_speed > 60:
-                slope.is_open = False
-            
-            if not slope.is_open and random.random() < cfg["reopen_probability"]:
-                if not (slope.difficulty == "black" and self.safety.avalanche_risk_index > 0.8):
-                    if not (slope.difficulty in ["black", "red"] and self.weather.wind_speed > 60):
-                        slope.is_open = True
-            
-            if slope.difficulty in ["green", "blue"] and random.random() < cfg["groom_probability"]:
-                slope.groomed = True
-            elif slope.groomed and random.random() < cfg["ungroom_probability"]:
-                slope.groomed = False
+        return incident_type, location, severity, self.current_time
 
     def get_state(self) -> ResortState:
         """Get the current complete resort state."""
-        return ResortState(
-            weather=self.weather,
-            lifts=self.lifts,
-            safety=self.safety,
-            slopes=self.slopes,
-            timestamp=self.current_time,
+        return self._build_state(self._state)
+
+    def _build_state(self, snap: _Snapshot) -> ResortState:
+        """Build the complete ResortState from a snapshot."""
+        return ResortState.model_construct(
+            weather=self._build_weather(snap),
+            lifts=self._build_lifts(snap),
+            safety=self._build_safety(snap),
+            slopes=self._build_slopes(snap),
+            timestamp=datetime.fromtimestamp(snap.current_time),
         )
+
+    def snapshot(self) -> ResortState:
+        """
+        Get the current resort state, building it at most once per tick.
+        Lock-free: reads a single published snapshot, so the result is
+        always consistent, and concurrent readers within a tick share it.
+        """
+        return self._materialize(self._state)
+
+    def snapshot_json(self) -> bytes:
+        """
+        Get the current resort state as serialized JSON, encoded at most
+        once per tick so high-frequency pollers get the cached bytes.
+        """
+        snap = self._state
+        cached = self._resort_json
+        if cached is not None and cached[0] == snap.version:
+            return cached[1]
+        body = orjson.dumps(self._materialize(snap).model_dump())
+        self._resort_json = (snap.version, body)
+        return body
+
+    def _materialize(self, snap: _Snapshot) -> ResortState:
+        """Build the ResortState for a snapshot, reusing the cached one."""
+        cached = self._resort_state
+        if cached is not None and cached[0] == snap.version:
+            return cached[1]
+        state = self._build_state(snap)
+        self._resort_state = (snap.version, state)
+        return state
+
+    def get_lift(self, lift_id: str) -> Optional[LiftData]:
+        """Get a single lift from the current snapshot, or None if unknown."""
+        i = self._lift_by_id.get(lift_id)
+        return None if i is None else self.snapshot().lifts[i]
+
+    def get_slope(self, slope_id: str) -> Optional[SlopeData]:
+        """Get a single slope from the current snapshot, or None if unknown."""
+        i = self._slope_by_id.get(slope_id)
+        return None if i is None else self.snapshot().slopes[i]
@@ -5,12 +5,12 @@ Continuously generates and serves synthetic ski resort telemetry data.
 import asyncio
 import logging
 import os
-import random
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
 # OpenTelemetry imports
 from opentelemetry import trace
@@ -37,17 +37,23 @@ async def data_update_loop():
     
     logger.info("Starting data generation loop")
     
+    # Schedule ticks against deadlines so time spent in update() does not
+    # stretch the interval between ticks.
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    
     while True:
         try:
-            generator.update()
+            # Tick on a worker thread so requests keep being served meanwhile
+            await asyncio.to_thread(generator.update)
             
-            cfg = generator.config["update_interval_seconds"]
-            interval = random.uniform(cfg["min"], cfg["max"])
-            await asyncio.sleep(interval)
+            next_tick = max(next_tick + generator.next_interval(), loop.time())
+            await asyncio.sleep(next_tick - loop.time())
             
         except Exception as e:
             logger.error(f"Error in data update loop: {e}", exc_info=True)
             await asyncio.sleep(5)
+            next_tick = loop.time()
 
 
 @asynccontextmanager
@@ -82,6 +88,7 @@ def create_app() -> FastAPI:
         description="Real-time synthetic telemetry data for ski resort operations",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     # Add CORS middleware
@@ -123,7 +130,7 @@ async def get_current_state():
     if generator is None:
         raise HTTPException(status_code=503, detail="Generator not initialized")
     
-    return generator.get_state()
+    return Response(content=generator.snapshot_json(), media_type="application/json")
 
 
 @app.get("/api/current-state/weather", response_model=WeatherData)
@@ -131,7 +138,7 @@ async def get_current_state_weather():
     """Get current weather conditions."""
     if generator is None:
         raise HTTPException(status_code=503, detail="Generator not initialized")
-    return generator.weather
+    return generator.snapshot().weather
 
 
 @app.get("/api/current-state/lifts", response_model=List[LiftData])
@@ -139,7 +146,7 @@ async def get_current_state_lifts():
     """Get data for all lifts."""
     if generator is None:
         raise HTTPException(status_code=503, detail="Generator not initialized")
-    return generator.lifts
+    return generator.snapshot().lifts
 
 
 @app.get("/api/current-state/safety", response_model=SafetyData)
@@ -147,7 +154,7 @@ async def get_current_state_safety():
     """Get current safety data."""
     if generator is None:
         raise HTTPException(status_code=503, detail="Generator not initialized")
-    return generator.safety
+    return generator.snapshot().safety
 
 
 @app.get("/api/current-state/slopes", response_model=List[SlopeData])
@@ -155,7 +162,7 @@ async def get_current_state_slopes():
     """Get data for all slopes."""
     if generator is None:
         raise HTTPException(status_code=503, detail="Generator not initialized")
-    return generator.slopes
+    return generator.snapshot().slopes
 
 
 @app.get("/api/weather", response_model=WeatherData)
@@ -164,7 +171,7 @@ async def get_weather():
     if generator is None:
         raise HTTPException(status_code=503, detail="Generator not initialized")
     
-    return generator.weather
+    return generator.snapshot().weather
 
 
 @app.get("/api/lifts", response_model=List[LiftData])
@@ -173,7 +180,7 @@ async def get_lifts():
     if generator is None:
         raise HTTPException(status_code=503, detail="Generator not initialized")
     
-    return generator.lifts
+    return generator.snapshot().lifts
 
 
 @app.get("/api/lifts/{lift_id}", response_model=LiftData)
@@ -182,7 +189,7 @@ async def get_lift(lift_id: str):
     if generator is None:
         raise HTTPException(status_code=503, detail="Generator not initialized")
     
-    lift = next((l for l in generator.lifts if l.lift_id == lift_id), None)
+    lift = generator.get_lift(lift_id)
     if lift is None:
         raise HTTPException(status_code=404, detail=f"Lift '{lift_id}' not found")
     
@@ -195,7 +202,7 @@ async def get_safety():
     if generator is None:
         raise HTTPException(status_code=503, detail="Generator not initialized")
     
-    return generator.safety
+    return generator.snapshot().safety
 
 
 @app.get("/api/slopes", response_model=List[SlopeData])
@@ -204,7 +211,7 @@ async def get_slopes():
     if generator is None:
         raise HTTPException(status_code=503, detail="Generator not initialized")
     
-    return generator.slopes
+    return generator.snapshot().slopes
 
 
 def main():
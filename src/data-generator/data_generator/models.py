@@ -1,59 +1,88 @@
 """
 Pydantic models for ski resort telemetry data.
+
+Models are frozen: the generator builds a fresh set per tick and readers share
+them, so nothing should mutate a published model.
 """
 from datetime import datetime
 from typing import Literal, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _TelemetryModel(BaseModel):
+    """Base for telemetry models: immutable, unknown keys ignored."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 
+class WeatherData(_TelemetryModel):
+    """
+    Current weather conditions at the resort.
 
-class WeatherData(BaseModel):
-    """Current weather conditions at the resort."""
-    temperature: float = Field(..., description="Temperature in Celsius, range -15 to 5")
-    wind_speed: float = Field(..., description="Wind speed in km/h, range 0 to 80")
-    snow_intensity: float = Field(..., description="Snowfall rate in cm/h, range 0 to 5")
-    visibility: float = Field(..., description="Visibility in meters, range 50 to 10000")
+    temperature is in Celsius (-15 to 5), wind_speed in km/h (0 to 80),
+    snow_intensity in cm/h (0 to 5) and visibility in meters (50 to 10000).
+    """
+    temperature: float
+    wind_speed: float
+    snow_intensity: float
+    visibility: float
     timestamp: datetime
 
 
-class LiftData(BaseModel):
-    """Data for a single ski lift."""
-    lift_id: str = Field(..., description="Unique lift identifier")
-    name: str = Field(..., description="Display name of the lift")
-    status: Literal["open", "closed", "maintenance"] = Field(..., description="Current operational status")
-    queue_length: int = Field(..., description="Number of people in queue, 0-200")
-    wait_time_minutes: float = Field(..., description="Estimated wait time in minutes")
-    throughput_rate: int = Field(..., description="People per hour capacity")
-    serves_slopes: List[str] = Field(default_factory=list, description="Slope IDs served by this lift")
+class LiftData(_TelemetryModel):
+    """
+    Data for a single ski lift.
+
+    queue_length is the number of people queueing (0-200), wait_time_minutes
+    the estimated wait, throughput_rate the capacity in people per hour and
+    serves_slopes the IDs of the slopes the lift serves.
+    """
+    lift_id: str
+    name: str
+    status: Literal["open", "closed", "maintenance"]
+    queue_length: int
+    wait_time_minutes: float
+    throughput_rate: int
+    serves_slopes: List[str] = Field(default_factory=list)
     timestamp: datetime
 
 
-class IncidentReport(BaseModel):
+class IncidentReport(_TelemetryModel):
     """Safety incident report."""
     incident_type: Literal["minor_injury", "collision", "lost_person", "equipment_failure", "avalanche_warning"]
-    location: str = Field(..., description="Location where incident occurred")
+    location: str
     severity: Literal["low", "medium", "high", "critical"]
     timestamp: datetime
 
 
-class SafetyData(BaseModel):
-    """Safety and risk assessment data."""
-    avalanche_risk_index: float = Field(..., description="Avalanche risk from 0.0 (safe) to 1.0 (extreme)")
-    incident_reports: List[IncidentReport] = Field(default_factory=list, description="Recent incident reports")
+class SafetyData(_TelemetryModel):
+    """
+    Safety and risk assessment data.
+
+    avalanche_risk_index ranges from 0.0 (safe) to 1.0 (extreme);
+    incident_reports holds the recent incident reports.
+    """
+    avalanche_risk_index: float
+    incident_reports: List[IncidentReport] = Field(default_factory=list)
     timestamp: datetime
 
 
-class SlopeData(BaseModel):
-    """Data for a single ski slope."""
-    slope_id: str = Field(..., description="Unique slope identifier")
-    name: str = Field(..., description="Display name of the slope")
-    difficulty: Literal["green", "blue", "red", "black"] = Field(..., description="Difficulty rating")
-    is_open: bool = Field(..., description="Whether the slope is currently open")
-    groomed: bool = Field(..., description="Whether the slope has been recently groomed")
-    snow_depth_cm: float = Field(..., description="Snow depth in centimeters")
-    served_by_lift_id: str = Field(..., description="Lift ID that serves this slope")
+class SlopeData(_TelemetryModel):
+    """
+    Data for a single ski slope.
+
+    groomed tells whether the slope has been recently groomed, snow_depth_cm
+    is the snow depth in centimeters and served_by_lift_id the lift serving it.
+    """
+    slope_id: str
+    name: str
+    difficulty: Literal["green", "blue", "red", "black"]
+    is_open: bool
+    groomed: bool
+    snow_depth_cm: float
+    served_by_lift_id: str
 
 
-class ResortState(BaseModel):
+class ResortState(_TelemetryModel):
     """Complete state of the ski resort at a point in time."""
     weather: WeatherData
     lifts: List[LiftData]
@@ -2,6 +2,7 @@
 Safety Agent Executor for A2A SDK.
 """
 import logging
+from functools import lru_cache
 from typing import override
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
@@ -11,17 +12,22 @@ from a2a.utils import new_agent_text_message
 from agent_framework.azure import AzureOpenAIChatClient
 from azure.identity import AzureCliCredential
 
+from tools import safety_tools
 from tools.safety_tools import evaluate_risk, is_slope_safe, get_closed_slopes
 
 logger = logging.getLogger(__name__)
 
 
-class SafetyAgentExecutor(AgentExecutor):
+# One credential per process, shared by every agent
+_credential = AzureCliCredential()
 
-    def __init__(self):
-        self.agent = AzureOpenAIChatClient(credential=AzureCliCredential()).as_agent(
-            name="safety-agent",
-            instructions="""You are the Safety Agent for AlpineAI ski resort. Your role is to evaluate risk across slopes using weather, avalanche, and visibility data. 
+
+@lru_cache(maxsize=1)
+def _build_agent():
+    """Build the safety agent once; credential and tool schemas are reused."""
+    return AzureOpenAIChatClient(credential=_credential).as_agent(
+        name="safety-agent",
+        instructions="""You are the Safety Agent for AlpineAI ski resort. Your role is to evaluate risk across slopes using weather, avalanche, and visibility data. 
 
 Safety is your top priority. Always err on the side of caution.
 
@@ -32,8 +38,18 @@ Risk levels:
 - Critical (>= 0.7): Recommend resort closure
 
 When in doubt, recommend caution.""",
-            tools=[evaluate_risk, is_slope_safe, get_closed_slopes],
-        )
+        tools=[evaluate_risk, is_slope_safe, get_closed_slopes],
+    )
+
+
+class SafetyAgentExecutor(AgentExecutor):
+
+    def __init__(self):
+        self.agent = _build_agent()
+
+    async def aclose(self) -> None:
+        """Release resources held by the agent's tools."""
+        await safety_tools.aclose()
 
     @override
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
@@ -4,6 +4,7 @@ Uses the official A2A Python SDK with FastAPI and JSON-RPC support.
 """
 import os
 import logging
+from contextlib import asynccontextmanager
 
 import uvicorn
 
@@ -97,7 +98,13 @@ def create_app():
         http_handler=http_handler
     )
 
-    app_instance = server.build()
+    @asynccontextmanager
+    async def lifespan(app):
+        """Close the executor's pooled HTTP connections on shutdown."""
+        yield
+        await agent_executor.aclose()
+
+    app_instance = server.build(lifespan=lifespan)
 
     from fastapi.middleware.cors import CORSMiddleware
     app_instance.add_middleware(
@@ -0,0 +1,56 @@
+"""
+Pydantic models for the data-generator telemetry consumed by the safety agent.
+
+These mirror the data-generator's response models. Timestamps are optional so
+fallback values can be built when the data-generator is unreachable.
+"""
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class WeatherData(BaseModel):
+    """Current weather conditions at the resort."""
+    temperature: float
+    wind_speed: float
+    snow_intensity: float
+    visibility: float
+    timestamp: Optional[datetime] = None
+
+
+class IncidentReport(BaseModel):
+    """Safety incident report."""
+    incident_type: Literal["minor_injury", "collision", "lost_person", "equipment_failure", "avalanche_warning"]
+    location: str
+    severity: Literal["low", "medium", "high", "critical"]
+    timestamp: datetime
+
+
+class SafetyData(BaseModel):
+    """Safety and risk assessment data."""
+    avalanche_risk_index: float
+    incident_reports: List[IncidentReport] = Field(default_factory=list)
+    timestamp: Optional[datetime] = None
+
+
+class SlopeData(BaseModel):
+    """Data for a single ski slope."""
+    slope_id: str
+    name: str
+    difficulty: Literal["green", "blue", "red", "black"]
+    is_open: bool
+    groomed: bool
+    snow_depth_cm: float
+    served_by_lift_id: str
+
+
+class ResortState(BaseModel):
+    """
+    Complete state of the ski resort at a point in time.
+    Lifts are not used by the safety agent and are ignored when parsing.
+    """
+    weather: WeatherData
+    safety: SafetyData
+    slopes: List[SlopeData] = Field(default_factory=list)
+    timestamp: Optional[datetime] = None
@@ -1,13 +1,95 @@
 """
 Safety Service - Data fetching and risk evaluation logic.
 """
+import asyncio
 import os
 import logging
-from typing import Dict, Any, List
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, Any, Callable, List, Optional, Tuple
 import httpx
 
+from .models import ResortState, SafetyData, SlopeData, WeatherData
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Risk factor descriptions, formatted with (wind_speed, visibility, snow_intensity, avalanche)
+_RISK_FACTORS = (
+    "Extreme wind speed: {0} km/h",
+    "High wind speed: {0} km/h",
+    "Very low visibility: {1}m",
+    "Low visibility: {1}m",
+    "Heavy snowfall: intensity {2}",
+    "Avalanche risk index: {3:.2f}",
+)
+
+
+def _risk_core(avalanche: float, wind_speed: float, visibility: float,
+               snow_intensity: float) -> Tuple[float, int]:
+    """
+    Numeric core of the risk rule engine. Returns the clamped risk score and
+    a bitmask of the rules that fired, bit i matching _RISK_FACTORS[i].
+    """
+    extreme_wind = wind_speed > 50
+    high_wind = 30 < wind_speed <= 50
+    very_low_vis = visibility < 500
+    low_vis = 500 <= visibility < 1000
+    heavy_snow = snow_intensity > 3
+
+    # Base risk from avalanche index plus weighted weather rules, clamped to [0, 1]
+    risk = (avalanche + 0.2 * extreme_wind + 0.1 * high_wind
+            + 0.15 * very_low_vis + 0.05 * low_vis + 0.1 * heavy_snow)
+    risk = max(0.0, min(1.0, risk))
+
+    mask = (extreme_wind | high_wind << 1 | very_low_vis << 2 | low_vis << 3
+            | heavy_snow << 4 | (avalanche > 0) << 5)
+    return risk, mask
+
+
+if _NUMBA_AVAILABLE:
+    _risk_core = njit(cache=True)(_risk_core)
+    # Compile at import rather than on the first request
+    _risk_core(0.0, 0.0, 5000.0, 0.0)
+
+# Risk levels and the scores at which each level after the first begins
+_RISK_LEVEL_THRESHOLDS = (0.3, 0.5, 0.7)
+_RISK_LEVELS = ("low", "moderate", "high", "critical")
+
+# Maximum acceptable risk score per slope difficulty
+_DIFFICULTY_THRESHOLDS = {"black": 0.5, "red": 0.6, "blue": 0.7, "green": 0.8}
+
+# Shared reason tuples for the common outcomes, so those paths allocate nothing
+_SAFE_REASONS = ("Slope is safe for skiing",)
+_CLOSED_REASONS = ("Slope is closed by resort management",)
+
+
+@dataclass(slots=True)
+class SlopeSummary:
+    """Slope fields reported alongside a risk evaluation."""
+    slope_id: str
+    name: str
+    difficulty: str
+    is_open: bool
+
+
+@dataclass(slots=True)
+class RiskResult:
+    """Risk evaluation for an area; serialized directly by orjson."""
+    area: str
+    risk_level: str
+    risk_score: float
+    factors: List[str]
+    affected_slopes: List[SlopeSummary]
+    weather: Optional[Dict[str, Any]] = None
+    incident_reports: List[Dict[str, Any]] = field(default_factory=list)
+
 
 class SafetyService:
     """
@@ -21,97 +103,100 @@ class SafetyService:
             logger.warning("services__data-generator__http__0 not set, using default")
             self.data_generator_url = "http://localhost:8080"
         
+        # One long-lived client so requests reuse pooled keep-alive connections
+        self._client = httpx.AsyncClient(
+            base_url=self.data_generator_url,
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=100),
+        )
+
+        # Tools run back-to-back within one agent turn, so briefly reuse
+        # responses; the data-generator only ticks every 1-3 seconds
+        self._cache_ttl = float(os.getenv("SAFETY_CACHE_TTL", "3.0"))
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
+        self._slope_index: Tuple[List[SlopeData], Dict[str, SlopeData], Tuple[str, ...]] = ([], {}, ())
+
         logger.info(f"SafetyService initialized with data-generator at: {self.data_generator_url}")
 
-    async def _fetch_weather(self) -> Dict[str, Any]:
-        """Fetch weather data from data-generator."""
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.data_generator_url}/api/weather")
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            logger.error(f"Error fetching weather data: {e}")
-            return {"temperature": 0, "wind_speed": 0, "snow_intensity": 0, "visibility": 5000}
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        await self._client.aclose()
 
-    async def _fetch_safety(self) -> Dict[str, Any]:
-        """Fetch safety data from data-generator."""
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.data_generator_url}/api/safety")
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            logger.error(f"Error fetching safety data: {e}")
-            return {"avalanche_risk_index": 0.0, "incident_reports": []}
+    async def _get(self, path: str, validate_json: Callable[[bytes], Any]) -> Any:
+        """
+        GET a data-generator endpoint and validate its JSON body, reusing a
+        result younger than the cache TTL. Concurrent misses for the same
+        path share one request.
+        """
+        entry = self._cache.get(path)
+        if entry is not None and time.monotonic() - entry[0] < self._cache_ttl:
+            return entry[1]
 
-    async def _fetch_slopes(self) -> List[Dict[str, Any]]:
-        """Fetch slopes data from data-generator."""
+        async with self._cache_locks.setdefault(path, asyncio.Lock()):
+            # Another caller may have refreshed the entry while we waited
+            entry = self._cache.get(path)
+            if entry is not None and time.monotonic() - entry[0] < self._cache_ttl:
+                return entry[1]
+
+            response = await self._client.get(path)
+            response.raise_for_status()
+            value = validate_json(response.content)
+            self._cache[path] = (time.monotonic(), value)
+            return value
+
+    async def _fetch_state(self) -> ResortState:
+        """Fetch weather, safety and slopes in one data-generator snapshot."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.data_generator_url}/api/slopes")
-                response.raise_for_status()
-                return response.json()
+            return await self._get("/api/current-state", ResortState.model_validate_json)
         except Exception as e:
-            logger.error(f"Error fetching slopes data: {e}")
-            return []
+            logger.error(f"Error fetching resort state: {e}")
+            return ResortState(
+                weather=WeatherData(temperature=0, wind_speed=0, snow_intensity=0, visibility=5000),
+                safety=SafetyData(avalanche_risk_index=0.0),
+            )
+
+    def _index_slopes(self, slopes: List[SlopeData]) -> Tuple[Dict[str, SlopeData], Tuple[str, ...]]:
+        """
+        Index slopes by ID and precompute their lowercased names (parallel to
+        `slopes`), rebuilt only when a new slopes list is fetched.
+        """
+        indexed, by_id, lower_names = self._slope_index
+        if indexed is not slopes:
+            by_id = {s.slope_id: s for s in slopes}
+            lower_names = tuple(s.name.lower() for s in slopes)
+            self._slope_index = (slopes, by_id, lower_names)
+        return by_id, lower_names
 
-    def _calculate_risk_score(self, weather: Dict[str, Any], safety: Dict[str, Any]) -> tuple[float, List[str]]:
+    def _calculate_risk_score(self, weather: WeatherData, safety: SafetyData) -> tuple[float, List[str]]:
         """
         Calculate risk score based on weather and safety data using rule engine.
         
         Returns:
             tuple: (risk_score, factors)
         """
-        # Base risk from avalanche index
-        risk = safety.get("avalanche_risk_index", 0.0)
-        factors = []
-        
-        # Wind speed rules
-        wind_speed = weather.get("wind_speed", 0)
-        if wind_speed > 50:
-            risk += 0.2
-            factors.append(f"Extreme wind speed: {wind_speed} km/h")
-        elif wind_speed > 30:
-            risk += 0.1
-            factors.append(f"High wind speed: {wind_speed} km/h")
-        
-        # Visibility rules
-        visibility = weather.get("visibility", 5000)
-        if visibility < 500:
-            risk += 0.15
-            factors.append(f"Very low visibility: {visibility}m")
-        elif visibility < 1000:
-            risk += 0.05
-            factors.append(f"Low visibility: {visibility}m")
-        
-        # Snow intensity rules
-        snow_intensity = weather.get("snow_intensity", 0)
-        if snow_intensity > 3:
-            risk += 0.1
-            factors.append(f"Heavy snowfall: intensity {snow_intensity}")
-        
-        # Add avalanche risk factor
-        if safety.get("avalanche_risk_index", 0) > 0:
-            factors.append(f"Avalanche risk index: {safety['avalanche_risk_index']:.2f}")
-        
-        # Clamp to [0, 1]
-        risk = max(0.0, min(1.0, risk))
+        avalanche = safety.avalanche_risk_index
+        wind_speed = weather.wind_speed
+        visibility = weather.visibility
+        snow_intensity = weather.snow_intensity
+
+        risk, mask = _risk_core(avalanche, wind_speed, visibility, snow_intensity)
+
+        # Only the rules that fired are formatted into factor strings
+        values = (wind_speed, visibility, snow_intensity, avalanche)
+        factors = [
+            template.format(*values)
+            for bit, template in enumerate(_RISK_FACTORS)
+            if mask >> bit & 1
+        ]
         
         return risk, factors
 
     def _get_risk_level(self, risk_score: float) -> str:
         """Convert risk score to risk level string."""
-        if risk_score < 0.3:
-            return "low"
-        elif risk_score < 0.5:
-            return "moderate"
-        elif risk_score < 0.7:
-            return "high"
-        else:
-            return "critical"
-
-    async def evaluate_risk(self, area: str) -> Dict[str, Any]:
+        return _RISK_LEVELS[bisect_right(_RISK_LEVEL_THRESHOLDS, risk_score)]
+
+    async def evaluate_risk(self, area: str) -> RiskResult:
         """
         Evaluate risk for a specific area or resort-wide.
         
@@ -119,54 +204,50 @@ class SafetyService:
             area: Area or zone name to evaluate. Use 'all' for resort-wide.
             
         Returns:
-            dict: Risk evaluation with risk_level, risk_score, factors, and affected_slopes
+            RiskResult: Risk evaluation with risk_level, risk_score, factors, and affected_slopes
         """
         try:
-            # Fetch all data
-            weather = await self._fetch_weather()
-            safety = await self._fetch_safety()
-            slopes = await self._fetch_slopes()
+            # One consistent snapshot; falls back to defaults on error
+            state = await self._fetch_state()
+            weather, safety, slopes = state.weather, state.safety, state.slopes
             
             # Calculate risk
             risk_score, factors = self._calculate_risk_score(weather, safety)
             risk_level = self._get_risk_level(risk_score)
             
             # Filter slopes by area
-            if area and area.lower() != "all":
+            needle = area.lower() if area else "all"
+            if needle != "all":
+                _, lower_names = self._index_slopes(slopes)
                 affected_slopes = [
-                    s for s in slopes 
-                    if area.lower() in s.get("name", "").lower()
+                    s for s, name in zip(slopes, lower_names)
+                    if needle in name
                 ]
             else:
                 affected_slopes = slopes
             
-            return {
-                "area": area if area else "all",
-                "risk_level": risk_level,
-                "risk_score": round(risk_score, 2),
-                "factors": factors,
-                "affected_slopes": [
-                    {
-                        "slope_id": s.get("slope_id"),
-                        "name": s.get("name"),
-                        "difficulty": s.get("difficulty"),
-                        "is_open": s.get("is_open"),
-                    }
+            return RiskResult(
+                area=area if area else "all",
+                risk_level=risk_level,
+                risk_score=round(risk_score, 2),
+                factors=factors,
+                affected_slopes=[
+                    SlopeSummary(s.slope_id, s.name, s.difficulty, s.is_open)
                     for s in affected_slopes
                 ],
-                "weather": weather,
-                "incident_reports": safety.get("incident_reports", [])
-            }
+                weather=weather.model_dump(mode="json", exclude_none=True),
+                incident_reports=[r.model_dump(mode="json") for r in safety.incident_reports],
+            )
             
         except Exception as e:
             logger.error(f"Error evaluating risk: {e}")
-            return {
-                "area": area,
-                "risk_level": "unknown",
-                "risk_score": 0.0,
-                "factors": [f"Error: {str(e)}"],
-                "affected_slopes": []
-            }
+            return RiskResult(
+                area=area,
+                risk_level="unknown",
+                risk_score=0.0,
+                factors=[f"Error: {str(e)}"],
+                affected_slopes=[],
+            )
 
     async def is_slope_safe(self, slope_id: str) -> Dict[str, Any]:
         """
@@ -179,17 +260,13 @@ class SafetyService:
             dict: Safety assessment with is_safe, risk_score, and reasons
         """
         try:
-            # Fetch all data
-            weather = await self._fetch_weather()
-            safety = await self._fetch_safety()
-            slopes = await self._fetch_slopes()
+            # One consistent snapshot; falls back to defaults on error
+            state = await self._fetch_state()
+            weather, safety, slopes = state.weather, state.safety, state.slopes
             
             # Find the slope
-            slope = None
-            for s in slopes:
-                if s.get("slope_id") == slope_id:
-                    slope = s
-                    break
+            by_id, _ = self._index_slopes(slopes)
+            slope = by_id.get(slope_id)
             
             if not slope:
                 return {
@@ -206,20 +283,14 @@ class SafetyService:
             is_safe = True
             
             # Check if slope is open
-            if not slope.get("is_open", False):
+            if not slope.is_open:
                 is_safe = False
-                reasons.append(f"Slope is currently closed")
-            
-            # Check risk based on difficulty level
-            difficulty = slope.get("difficulty", "").lower()
-            difficulty_thresholds = {
-                "black": 0.5,
-                "red": 0.6,
-                "blue": 0.7,
-                "green": 0.8
-            }
+                reasons.append("Slope is currently closed")
             
-            threshold = difficulty_thresholds.get(difficulty, 0.7)
+            # Check risk based on difficulty level; the model already restricts
+            # difficulty to the lowercase literals
+            difficulty = slope.difficulty
+            threshold = _DIFFICULTY_THRESHOLDS.get(difficulty, 0.7)
             
             if risk_score > threshold:
                 is_safe = False
@@ -234,11 +305,11 @@ class SafetyService:
             
             return {
                 "slope_id": slope_id,
-                "slope_name": slope.get("name"),
-                "difficulty": slope.get("difficulty"),
+                "slope_name": slope.name,
+                "difficulty": slope.difficulty,
                 "is_safe": is_safe,
                 "risk_score": round(risk_score, 2),
-                "reasons": reasons if reasons else ["Slope is safe for skiing"]
+                "reasons": reasons if reasons else _SAFE_REASONS
             }
             
         except Exception as e:
@@ -258,17 +329,17 @@ class SafetyService:
             dict: List of closed slopes with reasons
         """
         try:
-            slopes = await self._fetch_slopes()
+            slopes = (await self._fetch_state()).slopes
             
             closed_slopes = [
                 {
-                    "slope_id": s.get("slope_id"),
-                    "name": s.get("name"),
-                    "difficulty": s.get("difficulty"),
-                    "reasons": ["Slope is closed by resort management"]
+                    "slope_id": s.slope_id,
+                    "name": s.name,
+                    "difficulty": s.difficulty,
+                    "reasons": _CLOSED_REASONS
                 }
                 for s in slopes
-                if not s.get("is_open", False)
+                if not s.is_open
             ]
             
             return {
@@ -1,19 +1,114 @@
 """
 Ski Coach Service - Core business logic for slope recommendations and day planning.
 """
+import asyncio
+import heapq
+import math
 import os
 import logging
-from typing import Optional, Dict, Any, List
+import time
+from bisect import bisect_right
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Final, Iterator, NamedTuple, Optional, Dict, Any, List, Tuple
 import httpx
+import numpy as np
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Resort state shared by the tool calls of one agent turn. The value is a
+# mutable holder so a state fetched inside a tool's task is seen by the next.
+_TURN_STATE: ContextVar[Optional[Dict[str, Any]]] = ContextVar("turn_state", default=None)
+
+
+@contextmanager
+def agent_turn() -> Iterator[None]:
+    """Scope one agent turn: tool calls inside it see the same resort state."""
+    token = _TURN_STATE.set({})
+    try:
+        yield
+    finally:
+        _TURN_STATE.reset(token)
+
+# Feature tags that earn a slope the scenic bonus
+_SCENIC_TAGS: Final = frozenset({"scenic-views", "scenic"})
+
+# Wind bands: calm below 20 km/h, high above 40 km/h. The upper break sits
+# just above 40 so bisect_right only reaches the last band past it.
+_CALM_WIND_KMH: Final[float] = 20.0
+_HIGH_WIND_KMH: Final[float] = 40.0
+_WIND_BREAKS: Final = (_CALM_WIND_KMH, math.nextafter(_HIGH_WIND_KMH, math.inf))
+_WIND_BONUS: Final = (5.0, 0.0)  # Calm and moderate bands; high wind scales with speed
+_WIND_REASONS: Final = ("Calm winds", None, "High wind ({} km/h)")
+
+# Visibility bands: poor below 3 km, excellent above 8 km
+_VIS_BREAKS: Final = (3.0, math.nextafter(8.0, math.inf))
+_VIS_BONUS: Final = (-15.0, 0.0, 10.0)
+_VIS_REASONS: Final = ("Poor visibility", None, "Excellent visibility")
+
+# Lift queue lengths (people) behind the congestion reasons
+_SHORT_QUEUE: Final[int] = 10
+_LONG_QUEUE_AVOIDING_CROWDS: Final[int] = 20
+_LONG_QUEUE: Final[int] = 30
+
+# Avalanche index above which steep (red/black) slopes are penalized
+_AVALANCHE_STEEP_LIMIT: Final[int] = 6
+_STEEP_DIFFICULTIES: Final = frozenset({"black", "red"})
+
+# Reason category flags, set alongside the matching reason text
+_R_SHORT_LINES: Final[int] = 1 << 0
+_R_CALM: Final[int] = 1 << 1
+
+# Slopes suited to a quieter midday session
+_MIDDAY_MASK: Final[int] = _R_SHORT_LINES | _R_CALM
+
+# Difficulties for the morning warm-up session
+_WARMUP_DIFFICULTIES: Final = frozenset({"green", "blue"})
+
+
+@lru_cache(maxsize=256)
+def _parse_preferences_cached(preferences: str) -> frozenset:
+    return frozenset(filter(None, (p.strip() for p in preferences.lower().split(","))))
+
+
+def parse_preferences(preferences: Optional[str]) -> frozenset:
+    """
+    Parse a comma-separated preferences string into the set of enabled
+    preferences. Agents repeat the same few strings, so parses are memoized.
+    """
+    return _parse_preferences_cached(preferences) if preferences else frozenset()
+
+
+@dataclass(slots=True, frozen=True)
+class SlopeMeta:
+    """Static description of a slope; tag collections are frozensets for O(1) membership."""
+    difficulty: str
+    suitable_levels: frozenset
+    vertical_drop_m: int
+    length_m: int
+    features: frozenset
+
+
+class _Candidate(NamedTuple):
+    """Slope payload fields bound once per candidate, alongside its lift and metadata."""
+    slope_id: Optional[str]
+    name: Optional[str]
+    is_open: Any
+    groomed: Any
+    snow_quality: Optional[str]
+    lift: Optional[Dict[str, Any]]
+    metadata: Optional[SlopeMeta]
+    difficulty: str
+
 
 class CoachService:
     """Service for ski slope recommendations and day planning."""
     
     # Metadata for all slopes in the resort
-    SLOPE_METADATA = {
+    _RAW_SLOPE_METADATA = {
         "valley-run": {
             "difficulty": "green",
             "suitable_levels": ["beginner"],
@@ -72,6 +167,17 @@ class CoachService:
         },
     }
     
+    SLOPE_METADATA = {
+        sid: SlopeMeta(
+            difficulty=m["difficulty"],
+            suitable_levels=frozenset(m["suitable_levels"]),
+            vertical_drop_m=m["vertical_drop_m"],
+            length_m=m["length_m"],
+            features=frozenset(m["features"]),
+        )
+        for sid, m in _RAW_SLOPE_METADATA.items()
+    }
+    
     # Map skill levels to suitable difficulties
     SKILL_TO_DIFFICULTY = {
         "beginner": ["green", "blue"],
@@ -80,196 +186,273 @@ class CoachService:
         "expert": ["black", "red"],
     }
     
+    # Lookup tables derived once at class creation: difficulty sets for O(1)
+    # membership tests and each slope's difficulty without a metadata walk
+    _DIFFICULTY_SETS = {k: frozenset(v) for k, v in SKILL_TO_DIFFICULTY.items()}
+    _SLOPE_DIFFICULTY = {sid: m.difficulty for sid, m in SLOPE_METADATA.items()}
+    
     def __init__(self):
         """Initialize the coach service."""
         self.data_generator_url = os.environ.get("services__data-generator__http__0", "http://localhost:8080")
-        logger.info(f"CoachService initialized with data generator at: {self.data_generator_url}")
+        
+        # One long-lived client so requests reuse pooled keep-alive connections
+        self._client = httpx.AsyncClient(
+            base_url=self.data_generator_url,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        
+        # Both tools usually run within seconds of each other, so briefly reuse
+        # the fetched state; the data generator only ticks every 1-3 seconds
+        self._state_ttl = float(os.environ.get("COACH_CACHE_TTL", "2.0"))
+        self._state_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._state_lock = asyncio.Lock()
+        
+        logger.info("CoachService initialized with data generator at: %s", self.data_generator_url)
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        await self._client.aclose()
     
     async def _fetch_current_state(self) -> Dict[str, Any]:
-        """Fetch current resort state from data generator."""
+        """
+        Fetch current resort state, reusing the state already fetched in this
+        agent turn (see agent_turn) before falling back to the TTL cache.
+        """
+        turn = _TURN_STATE.get()
+        if turn is not None and "state" in turn:
+            return turn["state"]
+        
+        state = await self._fetch_cached_state()
+        if turn is not None:
+            turn["state"] = state
+        return state
+    
+    async def _fetch_cached_state(self) -> Dict[str, Any]:
+        """
+        Fetch current resort state from data generator, reusing a state younger
+        than the cache TTL. Concurrent callers share one in-flight request.
+        """
+        cached = self._state_cache
+        if cached is not None and time.monotonic() - cached[0] < self._state_ttl:
+            return cached[1]
+        
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.data_generator_url}/api/current-state")
+            async with self._state_lock:
+                # Another caller may have refreshed the state while we waited
+                cached = self._state_cache
+                if cached is not None and time.monotonic() - cached[0] < self._state_ttl:
+                    return cached[1]
+                
+                response = await self._client.get("/api/current-state")
                 response.raise_for_status()
-                return response.json()
+                state = orjson.loads(response.content)
+                self._state_cache = (time.monotonic(), state)
+                return state
         except Exception as e:
-            logger.error(f"Error fetching resort state: {e}")
+            logger.error("Error fetching resort state: %s", e)
             raise Exception(f"Failed to fetch resort state: {str(e)}")
     
-    def _parse_preferences(self, preferences: Optional[str]) -> Dict[str, bool]:
-        """Parse preferences string into a dictionary."""
-        if not preferences:
-            return {}
-        
-        prefs = {}
-        for pref in preferences.lower().split(','):
-            pref = pref.strip()
-            if pref:
-                prefs[pref] = True
-        return prefs
+    def _map_slopes_to_lifts(self, lifts: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Map each slope ID to the first lift that serves it."""
+        # Built in reverse so the first serving lift wins, as in a forward scan
+        return {slope_id: lift for lift in reversed(lifts) for slope_id in lift.get("serves_slopes", ())}
     
-    def _find_slope_lift(self, slope_id: str, lifts: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-        """Find the lift that serves this slope."""
-        for lift in lifts:
-            if slope_id in lift.get("serves_slopes", []):
-                return lift
-        return None
+    def _score_slopes_batch(
+        self,
+        candidates: List[_Candidate],
+        weather: Dict[str, Any],
+        safety: Dict[str, Any],
+        preferences: frozenset,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score candidates based on current conditions and preferences. Returns
+        a vector of scores and a vector of _R_* reason flags.
+        """
+        n = len(candidates)
+        has_lift = np.fromiter((bool(c.lift) for c in candidates), dtype=bool, count=n)
+        queue = np.fromiter(
+            (c.lift.get("queue_length", 0) if c.lift else 0 for c in candidates), dtype=np.float64, count=n
+        )
+        groomed = np.fromiter((bool(c.groomed) for c in candidates), dtype=bool, count=n)
+        powder = np.fromiter((c.snow_quality == "powder" for c in candidates), dtype=bool, count=n)
+        packed = np.fromiter((c.snow_quality == "packed" for c in candidates), dtype=bool, count=n)
+        steep = np.fromiter((c.difficulty in _STEEP_DIFFICULTIES for c in candidates), dtype=bool, count=n)
+        scenic = np.fromiter(
+            (c.metadata is not None and not _SCENIC_TAGS.isdisjoint(c.metadata.features) for c in candidates),
+            dtype=bool, count=n,
+        )
+        
+        # Terms are accumulated in the same order as the rules read, so the
+        # float results match scoring each slope on its own
+        score = np.full(n, 100.0)
+        
+        # Weather scoring (resort-wide, so scalar terms)
+        wind_speed = weather.get("wind_speed_kmh", 0)
+        wind_band = bisect_right(_WIND_BREAKS, wind_speed)
+        if wind_band < len(_WIND_BONUS):
+            score += _WIND_BONUS[wind_band]
+        else:
+            score -= (wind_speed - _HIGH_WIND_KMH) * 0.5
+        score += _VIS_BONUS[bisect_right(_VIS_BREAKS, weather.get("visibility_km", 10))]
+        
+        # Congestion scoring; heavy penalty for crowds if preferred
+        score -= np.where(has_lift, queue * (3 if "avoid_crowds" in preferences else 0.5), 0.0)
+        
+        # Safety scoring
+        avalanche_risk = safety.get("avalanche_risk_index", 3)
+        if avalanche_risk > _AVALANCHE_STEEP_LIMIT:
+            score -= np.where(steep, (avalanche_risk - _AVALANCHE_STEEP_LIMIT) * 5, 0.0)
+        
+        # Grooming preference
+        score += np.where(groomed, 5.0, -30.0 if "groomed_only" in preferences else 0.0)
+        
+        # Snow conditions and features bonuses
+        score += np.where(powder, 15.0, np.where(packed, 5.0, 0.0))
+        score += np.where(scenic, 3.0, 0.0)
+        
+        flags = np.where(has_lift & (queue < _SHORT_QUEUE), _R_SHORT_LINES, 0)
+        if wind_band == 0:
+            flags |= _R_CALM
+        
+        return score, flags
     
-    def _score_slope(
+    def _slope_reasons(
         self,
-        slope: Dict[str, Any],
+        candidate: _Candidate,
         weather: Dict[str, Any],
-        lifts: List[Dict[str, Any]],
         safety: Dict[str, Any],
-        preferences: Dict[str, bool],
-        metadata: Dict[str, Any],
-    ) -> tuple[float, List[str]]:
-        """Score a slope based on current conditions and preferences."""
-        score = 100.0
+        preferences: frozenset,
+    ) -> List[str]:
+        """Explain a slope's score in terms of current conditions and preferences."""
         reasons = []
         
-        # Weather scoring
+        # Weather
         wind_speed = weather.get("wind_speed_kmh", 0)
-        visibility = weather.get("visibility_km", 10)
-        
-        if wind_speed > 40:
-            penalty = (wind_speed - 40) * 0.5
-            score -= penalty
-            reasons.append(f"High wind ({wind_speed} km/h)")
-        elif wind_speed < 20:
-            score += 5
-            reasons.append("Calm winds")
-        
-        if visibility > 8:
-            score += 10
-            reasons.append("Excellent visibility")
-        elif visibility < 3:
-            score -= 15
-            reasons.append("Poor visibility")
-        
-        # Congestion scoring
-        lift = self._find_slope_lift(slope["slope_id"], lifts)
+        wind_reason = _WIND_REASONS[bisect_right(_WIND_BREAKS, wind_speed)]
+        if wind_reason:
+            reasons.append(wind_reason.format(wind_speed))
+        
+        visibility_reason = _VIS_REASONS[bisect_right(_VIS_BREAKS, weather.get("visibility_km", 10))]
+        if visibility_reason:
+            reasons.append(visibility_reason)
+        
+        # Congestion
+        lift = candidate.lift
         if lift:
             queue_length = lift.get("queue_length", 0)
-            if preferences.get("avoid_crowds"):
-                penalty = queue_length * 3  # Heavy penalty for crowds if preferred
-                score -= penalty
-                if queue_length > 20:
+            if "avoid_crowds" in preferences:
+                if queue_length > _LONG_QUEUE_AVOIDING_CROWDS:
                     reasons.append(f"Long wait at lift ({queue_length} people)")
             else:
-                penalty = queue_length * 0.5
-                score -= penalty
-                if queue_length > 30:
+                if queue_length > _LONG_QUEUE:
                     reasons.append(f"Very crowded ({queue_length} people)")
             
-            if queue_length < 10:
+            if queue_length < _SHORT_QUEUE:
                 reasons.append("Short lift lines")
         
-        # Safety scoring
+        # Safety
         avalanche_risk = safety.get("avalanche_risk_index", 3)
-        difficulty = metadata.get("difficulty", "blue")
         
-        if difficulty in ["black", "red"] and avalanche_risk > 6:
-            penalty = (avalanche_risk - 6) * 5
-            score -= penalty
+        if candidate.difficulty in _STEEP_DIFFICULTIES and avalanche_risk > _AVALANCHE_STEEP_LIMIT:
             reasons.append(f"Elevated avalanche risk (level {avalanche_risk})")
         
         # Grooming preference
-        if preferences.get("groomed_only") and not slope.get("groomed", False):
-            score -= 30
+        groomed = candidate.groomed
+        if "groomed_only" in preferences and not groomed:
             reasons.append("Not groomed")
-        elif slope.get("groomed", False):
-            score += 5
+        elif groomed:
             reasons.append("Freshly groomed")
         
-        # Snow conditions bonus
-        if slope.get("snow_quality") == "powder":
-            score += 15
+        # Snow conditions
+        snow_quality = candidate.snow_quality
+        if snow_quality == "powder":
             reasons.append("Powder conditions")
-        elif slope.get("snow_quality") == "packed":
-            score += 5
+        elif snow_quality == "packed":
             reasons.append("Good packed snow")
         
-        # Features bonus
-        features = metadata.get("features", [])
-        if "scenic-views" in features or "scenic" in features:
-            score += 3
-        
-        return score, reasons
+        return reasons
     
     async def recommend_slope(
         self,
         skill_level: str,
-        preferences: Optional[Dict[str, bool]] = None
+        preferences: frozenset = frozenset()
     ) -> Dict[str, Any]:
         """
         Recommend slopes based on skill level and preferences.
         
         Args:
             skill_level: Skier skill level (beginner, intermediate, advanced, expert)
-            preferences: Optional dict of preferences (avoid_crowds, groomed_only, etc.)
+            preferences: Set of enabled preferences (avoid_crowds, groomed_only, etc.),
+                as returned by parse_preferences
         
         Returns:
             Dict with top 3 slope recommendations
         """
         # Normalize skill level
         skill_level = skill_level.lower()
-        if skill_level not in self.SKILL_TO_DIFFICULTY:
+        if skill_level not in self._DIFFICULTY_SETS:
             raise ValueError(f"Invalid skill level: {skill_level}. Must be one of: beginner, intermediate, advanced, expert")
         
         # Fetch current state
         state = await self._fetch_current_state()
         slopes = state.get("slopes", [])
         weather = state.get("weather", {})
-        lifts = state.get("lifts", [])
+        slope_to_lift = self._map_slopes_to_lifts(state.get("lifts", []))
         safety = state.get("safety", {})
         
         # Get suitable difficulties for this skill level
-        suitable_difficulties = self.SKILL_TO_DIFFICULTY[skill_level]
+        suitable_difficulties = self._DIFFICULTY_SETS[skill_level]
         
-        # Filter slopes
+        # Filter slopes, reading each payload field once
+        groomed_only = "groomed_only" in preferences
         candidates = []
         for slope in slopes:
-            slope_id = slope.get("slope_id")
-            metadata = self.SLOPE_METADATA.get(slope_id, {})
-            
             # Must be open
-            if not slope.get("is_open", False):
+            is_open = slope.get("is_open")
+            if not is_open:
                 continue
             
             # Must match skill level
-            difficulty = metadata.get("difficulty", "blue")
+            slope_id = slope.get("slope_id")
+            difficulty = self._SLOPE_DIFFICULTY.get(slope_id, "blue")
             if difficulty not in suitable_difficulties:
                 continue
             
             # Apply groomed_only filter
-            if preferences and preferences.get("groomed_only") and not slope.get("groomed", False):
+            groomed = slope.get("groomed")
+            if groomed_only and not groomed:
                 continue
             
-            # Score the slope
-            score, reasons = self._score_slope(slope, weather, lifts, safety, preferences or {}, metadata)
-            
-            candidates.append({
-                "slope_id": slope_id,
-                "slope_name": slope.get("slope_name", slope_id),
-                "difficulty": difficulty,
-                "score": score,
-                "reasons": reasons,
-                "metadata": metadata,
+            candidates.append(_Candidate(
+                slope_id, slope.get("slope_name", slope_id), is_open, groomed, slope.get("snow_quality"),
+                slope_to_lift.get(slope_id), self.SLOPE_METADATA.get(slope_id), difficulty,
+            ))
+        
+        # Score all candidates at once, then select the top 3 without a full
+        # sort (nlargest is stable, so ties keep resort order) and only
+        # explain those
+        scores, _ = self._score_slopes_batch(candidates, weather, safety, preferences)
+        scores = scores.tolist()
+        top_recommendations = []
+        for i in heapq.nlargest(3, range(len(candidates)), key=scores.__getitem__):
+            c = candidates[i]
+            top_recommendations.append({
+                "slope_id": c.slope_id,
+                "slope_name": c.name,
+                "difficulty": c.difficulty,
+                "score": scores[i],
+                "reasons": self._slope_reasons(c, weather, safety, preferences)[:3],
                 "current_conditions": {
-                    "is_open": slope.get("is_open"),
-                    "groomed": slope.get("groomed"),
-                    "snow_quality": slope.get("snow_quality"),
+                    "is_open": c.is_open,
+                    "groomed": c.groomed,
+                    "snow_quality": c.snow_quality,
                 }
             })
         
-        # Sort by score and take top 3
-        candidates.sort(key=lambda x: x["score"], reverse=True)
-        top_recommendations = candidates[:3]
-        
         return {
             "skill_level": skill_level,
-            "preferences": preferences or {},
+            "preferences": sorted(preferences),
             "current_weather": {
                 "condition": weather.get("condition"),
                 "temperature_c": weather.get("temperature_c"),
@@ -291,100 +474,96 @@ class CoachService:
         """
         # Normalize skill level
         skill_level = skill_level.lower()
-        if skill_level not in self.SKILL_TO_DIFFICULTY:
+        if skill_level not in self._DIFFICULTY_SETS:
             raise ValueError(f"Invalid skill level: {skill_level}. Must be one of: beginner, intermediate, advanced, expert")
         
         # Fetch current state
         state = await self._fetch_current_state()
         slopes = state.get("slopes", [])
         weather = state.get("weather", {})
-        lifts = state.get("lifts", [])
+        slope_to_lift = self._map_slopes_to_lifts(state.get("lifts", []))
         safety = state.get("safety", {})
         
         # Get suitable difficulties
-        suitable_difficulties = self.SKILL_TO_DIFFICULTY[skill_level]
+        suitable_difficulties = self._DIFFICULTY_SETS[skill_level]
         
-        # Prepare slope data
-        slope_data = []
+        # Prepare slope data, reading each payload field once
+        candidates = []
         for slope in slopes:
-            if not slope.get("is_open", False):
+            is_open = slope.get("is_open")
+            if not is_open:
                 continue
             
             slope_id = slope.get("slope_id")
-            metadata = self.SLOPE_METADATA.get(slope_id, {})
-            difficulty = metadata.get("difficulty", "blue")
+            difficulty = self._SLOPE_DIFFICULTY.get(slope_id, "blue")
             
             if difficulty not in suitable_difficulties:
                 continue
             
-            score, reasons = self._score_slope(slope, weather, lifts, safety, {}, metadata)
-            
-            slope_data.append({
-                "slope_id": slope_id,
-                "slope_name": slope.get("slope_name", slope_id),
-                "difficulty": difficulty,
-                "score": score,
-                "reasons": reasons,
-                "metadata": metadata,
-            })
-        
-        slope_data.sort(key=lambda x: x["score"], reverse=True)
+            candidates.append(_Candidate(
+                slope_id, slope.get("slope_name", slope_id), is_open, slope.get("groomed"), slope.get("snow_quality"),
+                slope_to_lift.get(slope_id), self.SLOPE_METADATA.get(slope_id), difficulty,
+            ))
+        
+        # Score all candidates at once, best first (stable, so ties keep resort order)
+        scores, flags = self._score_slopes_batch(candidates, weather, safety, frozenset())
+        flags = flags.tolist()
+        
+        # One pass over the ranking fills every time slot: easier slopes for the
+        # morning, quieter ones for midday, and the top four for the afternoon
+        # and the fallbacks
+        morning, midday, top = [], [], []
+        for i in np.argsort(-scores, kind="stable").tolist():
+            if len(top) < 4:
+                top.append(i)
+            if len(morning) < 2 and candidates[i].difficulty in _WARMUP_DIFFICULTIES:
+                morning.append(i)
+            if len(midday) < 2 and flags[i] & _MIDDAY_MASK:
+                midday.append(i)
+            if len(top) == 4 and len(morning) == 2 and len(midday) == 2:
+                break
+        
+        # Reasons are built lazily, once per slope that makes it into the plan
+        reasons_by_index: Dict[int, List[str]] = {}
+        
+        def project(i: int, n: int) -> Dict[str, Any]:
+            """Plan entry for candidate i with its top n reasons."""
+            reasons = reasons_by_index.get(i)
+            if reasons is None:
+                reasons = reasons_by_index[i] = self._slope_reasons(candidates[i], weather, safety, frozenset())
+            c = candidates[i]
+            return {"name": c.name, "difficulty": c.difficulty, "reasons": reasons[:n]}
         
         # Build the plan
         plan = []
         
         # Morning: Warm-up on easier slopes
-        morning_slopes = [s for s in slope_data if s["difficulty"] in ["green", "blue"]][:2]
-        if not morning_slopes:
-            morning_slopes = slope_data[:2]
+        if not morning:
+            morning = top[:2]
         
         plan.append({
             "time_slot": "Morning (9:00 - 12:00)",
             "recommendation": "Warm-up session - Start with easier slopes to get your legs ready",
-            "slopes": [
-                {
-                    "name": s["slope_name"],
-                    "difficulty": s["difficulty"],
-                    "reasons": s["reasons"][:2],  # Top 2 reasons
-                }
-                for s in morning_slopes
-            ],
+            "slopes": [project(i, 2) for i in morning],  # Top 2 reasons
             "tips": "Take it easy and focus on technique. Check your equipment and get comfortable."
         })
         
         # Midday: Break and less crowded slopes
-        midday_slopes = [s for s in slope_data if any("Short lift lines" in r or "calm" in r.lower() for r in s["reasons"])][:2]
-        if not midday_slopes:
-            midday_slopes = slope_data[2:4] if len(slope_data) > 2 else slope_data[:2]
+        if not midday:
+            midday = top[2:4] if len(top) > 2 else top[:2]
         
         plan.append({
             "time_slot": "Midday (12:00 - 14:00)",
             "recommendation": "Lunch break and light skiing - Avoid peak crowds",
-            "slopes": [
-                {
-                    "name": s["slope_name"],
-                    "difficulty": s["difficulty"],
-                    "reasons": s["reasons"][:2],
-                }
-                for s in midday_slopes
-            ],
+            "slopes": [project(i, 2) for i in midday],
             "tips": "Stay hydrated and take a proper lunch break. Ski a few lighter runs to stay loose."
         })
         
         # Afternoon: Best conditions
-        afternoon_slopes = slope_data[:3]
-        
         plan.append({
             "time_slot": "Afternoon (14:00 - 16:00)",
             "recommendation": "Prime time - Best conditions and your peak performance",
-            "slopes": [
-                {
-                    "name": s["slope_name"],
-                    "difficulty": s["difficulty"],
-                    "reasons": s["reasons"][:3],
-                }
-                for s in afternoon_slopes
-            ],
+            "slopes": [project(i, 3) for i in top[:3]],
             "tips": "You're warmed up and conditions are optimal. Push yourself but know your limits!"
         })
         
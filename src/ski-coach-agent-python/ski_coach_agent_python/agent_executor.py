@@ -1,8 +1,9 @@
 """
 Ski Coach Agent Executor for A2A SDK.
 """
+import asyncio
 import logging
-from typing import override
+from typing import Any, ClassVar, override
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
@@ -11,25 +12,46 @@ from a2a.utils import new_agent_text_message
 from agent_framework.azure import AzureOpenAIChatClient
 from azure.identity import AzureCliCredential
 
+from services.coach_service import agent_turn
+from tools import coach_tools
 from tools.coach_tools import recommend_slope, build_day_plan
 
 logger = logging.getLogger(__name__)
 
+# One credential per process, shared by every agent
+_credential = AzureCliCredential()
 
-class SkiCoachAgentExecutor(AgentExecutor):
-
-    def __init__(self):
-        self.agent = AzureOpenAIChatClient(credential=AzureCliCredential()).as_agent(
-            name="ski-coach-agent",
-            instructions="""You are the Ski Coach Agent for AlpineAI ski resort. You help skiers find the best slopes based on their skill level, preferences, and current conditions.
+_INSTRUCTIONS = """You are the Ski Coach Agent for AlpineAI ski resort. You help skiers find the best slopes based on their skill level, preferences, and current conditions.
 
 When users ask for recommendations, always ask about their skill level if not provided (beginner, intermediate, advanced, expert).
 Use the recommend_slope tool to get current conditions and recommendations.
 Use the build_day_plan tool to create a structured day schedule.
 
-Always be encouraging and helpful. Skiing should be fun and safe!""",
-            tools=[recommend_slope, build_day_plan],
-        )
+Always be encouraging and helpful. Skiing should be fun and safe!"""
+
+
+class SkiCoachAgentExecutor(AgentExecutor):
+
+    # Built on first use and shared by every executor instance
+    _agent_singleton: ClassVar[Any] = None
+    _agent_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
+    async def _get_agent(self) -> Any:
+        """Return the shared coach agent, building it on first use."""
+        cls = type(self)
+        if cls._agent_singleton is None:
+            async with cls._agent_lock:
+                if cls._agent_singleton is None:
+                    cls._agent_singleton = AzureOpenAIChatClient(credential=_credential).as_agent(
+                        name="ski-coach-agent",
+                        instructions=_INSTRUCTIONS,
+                        tools=[recommend_slope, build_day_plan],
+                    )
+        return cls._agent_singleton
+
+    async def aclose(self) -> None:
+        """Release resources held by the agent's tools."""
+        await coach_tools.aclose()
 
     @override
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
@@ -38,10 +60,14 @@ Always be encouraging and helpful. Skiing should be fun and safe!""",
             raise Exception('No message provided')
 
         try:
-            response = await self.agent.run(query)
+            agent = await self._get_agent()
+            # Tools called during this turn share one fetched resort state
+            with agent_turn():
+                response = await agent.run(query)
             await event_queue.enqueue_event(new_agent_text_message(response.text))
         except Exception as e:
-            logger.error(f"Error during execution: {e}", exc_info=True)
+            # Tracebacks are costly to format, so they are only captured when debugging
+            logger.error("Error during execution: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             await event_queue.enqueue_event(new_agent_text_message(f"Error: {str(e)}"))
 
     @override
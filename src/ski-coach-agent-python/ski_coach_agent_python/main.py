@@ -4,6 +4,7 @@ Uses the official A2A Python SDK with FastAPI and JSON-RPC support.
 """
 import os
 import logging
+from contextlib import asynccontextmanager
 
 import uvicorn
 
@@ -31,7 +32,19 @@ from agent_framework.observability import configure_otel_providers
 # Local imports
 from .agent_executor import SkiCoachAgentExecutor
 
-logging.basicConfig(level=logging.INFO)
+# Level names accepted by both logging and uvicorn
+_LOG_LEVELS = ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG")
+
+
+def _log_level(name: str) -> str:
+    """Map a level name to its canonical form (WARN -> WARNING), falling back to WARNING."""
+    level = logging.getLevelName(logging.getLevelName(name.upper()))
+    return level if level in _LOG_LEVELS else "WARNING"
+
+
+# WARNING by default keeps per-request INFO logs (httpx, uvicorn) off the hot path
+LOG_LEVEL = _log_level(os.environ.get("LOG_LEVEL", "WARNING"))
+logging.basicConfig(level=LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
 
@@ -92,8 +105,6 @@ def create_app():
     port = int(os.environ.get("PORT", 8083))
     host = os.environ.get("HOST", "0.0.0.0")
 
-    configure_otel_providers()
-
     agent_card = get_agent_card(host, port)
     agent_executor = SkiCoachAgentExecutor()
     task_store = InMemoryTaskStore()
@@ -108,7 +119,13 @@ def create_app():
         http_handler=http_handler
     )
 
-    app_instance = server.build()
+    @asynccontextmanager
+    async def lifespan(app):
+        """Close pooled HTTP connections on shutdown."""
+        yield
+        await agent_executor.aclose()
+
+    app_instance = server.build(lifespan=lifespan)
 
     from fastapi.middleware.cors import CORSMiddleware
     app_instance.add_middleware(
@@ -125,16 +142,27 @@ def create_app():
 
     otel_endpoint = os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT")
     if otel_endpoint:
+        # Telemetry is only wired up when there is a collector to export to
+        configure_otel_providers()
         trace.set_tracer_provider(TracerProvider())
         otlp_exporter = OTLPSpanExporter(endpoint=otel_endpoint)
-        processor = BatchSpanProcessor(otlp_exporter)
+        # Larger, less frequent batches amortize export cost off the request path
+        processor = BatchSpanProcessor(
+            otlp_exporter,
+            max_queue_size=4096,
+            schedule_delay_millis=5000,
+            max_export_batch_size=512,
+        )
         trace.get_tracer_provider().add_span_processor(processor)
         FastAPIInstrumentor().instrument_app(app_instance)
 
     return app_instance
 
 
-app = create_app()
+# Built when imported by uvicorn; under "python -m" main() hands uvicorn the
+# import string, which imports this module again and builds the app there
+if __name__ != "__main__":
+    app = create_app()
 
 
 def main():
@@ -142,8 +170,20 @@ def main():
     port = int(os.environ.get("PORT", 8083))
     host = os.environ.get("HOST", "0.0.0.0")
 
-    logger.info(f"Ski Coach Agent starting on http://{host}:{port}")
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # Task state lives in an in-memory store per process, so extra workers are opt-in
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+    logger.info("Ski Coach Agent starting on http://%s:%s with %s worker(s)", host, port, workers)
+    # Workers are spawned from the import string; uvloop is picked when installed
+    uvicorn.run(
+        "ski_coach_agent_python.main:app",
+        host=host,
+        port=port,
+        log_level=LOG_LEVEL.lower(),
+        loop="auto",
+        http="httptools",
+        workers=workers,
+    )
 
 
 if __name__ == "__main__":
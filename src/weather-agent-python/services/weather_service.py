@@ -1,14 +1,47 @@
 """
 Weather service for fetching data from the data-generator service.
 """
+import asyncio
 import os
 import logging
-import random
-from typing import Dict, Any, List
+import operator
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
 import httpx
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Random source for forecast variations
+_rng = np.random.default_rng()
+
+
+# Storm rules: (field, default, storm test, storm threshold, storm message,
+# warning test, warning threshold, warning message). Warnings are only
+# reported when no storm rule fires; messages are formatted with the value.
+_STORM_RULES = (
+    ("wind_speed", 0,
+     operator.gt, 50, "High wind speed detected: {} km/h",
+     operator.gt, 40, "Elevated wind speed: {} km/h"),
+    ("snow_intensity", 0,
+     operator.gt, 3, "Heavy snow intensity: {}/5",
+     operator.ge, 3, "Moderate to heavy snow: {}/5"),
+    ("visibility", 10000,
+     operator.lt, 500, "Low visibility: {}m",
+     operator.lt, 1000, "Reduced visibility: {}m"),
+)
+
+
+@dataclass(slots=True)
+class ForecastHour:
+    """One hourly forecast entry; orjson serializes it like the equivalent dict."""
+    hour: int
+    temperature: float
+    wind_speed: float
+    snow_intensity: float
+    visibility: float
+
 
 class WeatherService:
     """Service for fetching and processing weather data from the data-generator."""
@@ -20,8 +53,43 @@ class WeatherService:
             logger.warning("services__data-generator__http__0 environment variable not set")
             self.data_generator_url = "http://localhost:8080"  # Fallback
         
+        # One long-lived client so requests reuse pooled keep-alive connections.
+        # Connects fail fast while slow upstream reads keep the full budget.
+        self._client = httpx.AsyncClient(
+            base_url=self.data_generator_url,
+            timeout=httpx.Timeout(connect=2.0, read=10.0, write=5.0, pool=5.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=100, keepalive_expiry=30.0),
+        )
+        
+        # Fetch shared by concurrent callers while it is in flight
+        self._inflight: Optional[asyncio.Task] = None
+        
+        # Forecast scratch buffers keyed by hour count (at most 24 entries)
+        self._scratch: Dict[int, np.ndarray] = {}
+        
+        # Tool calls within a conversation reuse recent conditions; only
+        # successful fetches are cached, never the fallback data
+        self._ttl = float(os.environ.get("WEATHER_CACHE_TTL", "30"))
+        self._cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
         logger.info(f"WeatherService initialized with data-generator URL: {self.data_generator_url}")
     
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        await self._client.aclose()
+    
+    async def _fetch_current(self) -> Dict[str, Any]:
+        """GET the current weather from the data-generator."""
+        response = await self._client.get("/api/weather")
+        response.raise_for_status()
+        data = response.json()
+        self._cache = (time.monotonic(), data)
+        return data
+    
+    def _clear_inflight(self, task: asyncio.Task) -> None:
+        if self._inflight is task:
+            self._inflight = None
+    
     async def get_current_conditions(self) -> Dict[str, Any]:
         """
         Get current weather conditions from the data-generator.
@@ -29,13 +97,23 @@ class WeatherService:
         Returns:
             dict: Current weather data with temperature, wind_speed, snow_intensity, visibility, timestamp
         """
+        cached = self._cache
+        if cached is not None and time.monotonic() - cached[0] < self._ttl:
+            logger.info(f"Retrieved current weather conditions (cache_hit=True): {cached[1]}")
+            return cached[1]
+        
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.data_generator_url}/api/weather")
-                response.raise_for_status()
-                data = response.json()
-                logger.info(f"Retrieved current weather conditions: {data}")
-                return data
+            # Concurrent callers join the request already in flight. The check
+            # and the assignment run without an await in between, so no lock
+            # is needed.
+            task = self._inflight
+            if task is None:
+                task = self._inflight = asyncio.create_task(self._fetch_current())
+                task.add_done_callback(self._clear_inflight)
+            # Shielded so one cancelled caller does not cancel the shared fetch
+            data = await asyncio.shield(task)
+            logger.info(f"Retrieved current weather conditions (cache_hit=False): {data}")
+            return data
         except Exception as e:
             logger.error(f"Error fetching current weather conditions: {e}")
             # Return fallback data
@@ -48,12 +126,13 @@ class WeatherService:
                 "error": str(e)
             }
     
-    async def get_forecast(self, hours: int) -> Dict[str, Any]:
+    async def get_forecast(self, hours: int, current: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generate a weather forecast by projecting current conditions forward.
         
         Args:
             hours: Number of hours to forecast (1-24)
+            current: Already fetched current conditions; fetched when omitted
             
         Returns:
             dict: Forecast data with hourly projections
@@ -63,30 +142,51 @@ class WeatherService:
         
         try:
             # Get current conditions as baseline
-            current = await self.get_current_conditions()
-            
-            # Generate hourly forecast with small random variations
-            forecast_hours: List[Dict[str, Any]] = []
+            if current is None:
+                current = await self.get_current_conditions()
             
             base_temp = current.get("temperature", -5.0)
             base_wind = current.get("wind_speed", 15.0)
             base_snow = current.get("snow_intensity", 1)
             base_visibility = current.get("visibility", 5000)
             
-            for hour in range(1, hours + 1):
-                # Add random variations to simulate forecast
-                temp_variation = random.uniform(-2, 2)
-                wind_variation = random.uniform(-5, 5)
-                snow_variation = random.randint(-1, 1)
-                visibility_variation = random.randint(-500, 500)
-                
-                forecast_hours.append({
-                    "hour": hour,
-                    "temperature": round(base_temp + temp_variation, 1),
-                    "wind_speed": round(max(0, base_wind + wind_variation), 1),
-                    "snow_intensity": max(0, min(5, base_snow + snow_variation)),
-                    "visibility": max(100, base_visibility + visibility_variation)
-                })
+            # Generate all hours at once with small random variations. One
+            # draw fills a reused (4, hours) buffer of [0, 1) samples, which is
+            # scaled in place; nothing awaits until it has been read back.
+            buf = self._scratch.get(hours)
+            if buf is None:
+                buf = self._scratch[hours] = np.empty((4, hours))
+            _rng.random(out=buf)
+            temperature, wind_speed, snow_intensity, visibility = buf
+            
+            # Temperature: base +/- 2
+            temperature *= 4
+            temperature += base_temp - 2
+            np.round(temperature, 1, out=temperature)
+            
+            # Wind: base +/- 5, never negative
+            wind_speed *= 10
+            wind_speed += base_wind - 5
+            np.maximum(wind_speed, 0, out=wind_speed)
+            np.round(wind_speed, 1, out=wind_speed)
+            
+            # Snow: base + a whole step in {-1, 0, 1}, within 0-5
+            snow_intensity *= 3
+            np.floor(snow_intensity, out=snow_intensity)
+            snow_intensity += base_snow - 1
+            np.clip(snow_intensity, 0, 5, out=snow_intensity)
+            
+            # Visibility: base + a whole step in -500..500, at least 100m
+            visibility *= 1001
+            np.floor(visibility, out=visibility)
+            visibility += base_visibility - 500
+            np.maximum(visibility, 100, out=visibility)
+            
+            # tolist() converts every column to Python floats in one call
+            forecast_hours: List[ForecastHour] = [
+                ForecastHour(*row)
+                for row in zip(range(1, hours + 1), *buf.tolist())
+            ]
             
             return {
                 "current_conditions": current,
@@ -102,44 +202,37 @@ class WeatherService:
                 "hourly_forecast": []
             }
     
-    async def is_storm_incoming(self) -> Dict[str, Any]:
+    async def is_storm_incoming(self, current: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Assess if a storm is incoming based on current conditions.
         
+        Args:
+            current: Already fetched current conditions; fetched when omitted
+            
         Returns:
             dict: Storm assessment with storm_incoming (bool) and reason (str)
         """
         try:
-            current = await self.get_current_conditions()
-            
-            wind_speed = current.get("wind_speed", 0)
-            snow_intensity = current.get("snow_intensity", 0)
-            visibility = current.get("visibility", 10000)
-            
-            reasons = []
-            storm_incoming = False
-            
-            # Check storm conditions
-            if wind_speed > 50:
-                reasons.append(f"High wind speed detected: {wind_speed} km/h")
-                storm_incoming = True
-            
-            if snow_intensity > 3:
-                reasons.append(f"Heavy snow intensity: {snow_intensity}/5")
-                storm_incoming = True
+            if current is None:
+                current = await self.get_current_conditions()
             
-            if visibility < 500:
-                reasons.append(f"Low visibility: {visibility}m")
-                storm_incoming = True
+            values = [current.get(field, default) for field, default, *_ in _STORM_RULES]
             
-            # Also check for warning signs (not quite storm level but concerning)
+            # Check storm conditions, then warning signs (not quite storm level
+            # but concerning); only the rules that fire format a message
+            reasons = [
+                storm_message.format(value)
+                for value, (_, _, storm_test, storm_at, storm_message, *_) in zip(values, _STORM_RULES)
+                if storm_test(value, storm_at)
+            ]
+            storm_incoming = bool(reasons)
             if not storm_incoming:
-                if wind_speed > 40:
-                    reasons.append(f"Elevated wind speed: {wind_speed} km/h")
-                if snow_intensity >= 3:
-                    reasons.append(f"Moderate to heavy snow: {snow_intensity}/5")
-                if visibility < 1000:
-                    reasons.append(f"Reduced visibility: {visibility}m")
+                reasons = [
+                    warn_message.format(value)
+                    for value, (*_, warn_test, warn_at, warn_message) in zip(values, _STORM_RULES)
+                    if warn_test(value, warn_at)
+                ]
+            wind_speed, snow_intensity, visibility = values
             
             if storm_incoming:
                 reason = "Storm conditions detected: " + "; ".join(reasons)
@@ -1,10 +1,10 @@
 """
 Weather tools - AI agent tools for weather-related functions.
 """
-import json
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
+import orjson
 from pydantic import Field
 from agent_framework import tool
 
@@ -12,17 +12,31 @@ from services.weather_service import WeatherService
 
 logger = logging.getLogger(__name__)
 
-_weather_service = WeatherService()
+# Created per worker process on app startup, so each worker owns its connection pool
+_weather_service: Optional[WeatherService] = None
+
+
+def _service() -> WeatherService:
+    """Return this process's weather service, creating it on first use."""
+    global _weather_service
+    if _weather_service is None:
+        _weather_service = WeatherService()
+    return _weather_service
+
+
+def start() -> None:
+    """Create the weather service and its HTTP client for this process."""
+    _service()
 
 
 @tool(name="get_current_conditions", description="Get current weather conditions at the ski resort including temperature, wind speed, snow intensity, and visibility")
 async def get_current_conditions() -> str:
     try:
-        conditions = await _weather_service.get_current_conditions()
-        return json.dumps(conditions, indent=2)
+        conditions = await _service().get_current_conditions()
+        return orjson.dumps(conditions).decode()
     except Exception as e:
         logger.error(f"Error getting current conditions: {e}")
-        return json.dumps({"error": str(e)})
+        return orjson.dumps({"error": str(e)}).decode()
 
 
 @tool(name="get_forecast", description="Get a weather forecast for the specified number of hours ahead (1-24)")
@@ -30,19 +44,46 @@ async def get_forecast(
     hours: Annotated[int, Field(description="Number of hours to forecast, 1-24")] = 6,
 ) -> str:
     try:
-        forecast = await _weather_service.get_forecast(hours)
-        return json.dumps(forecast, indent=2)
+        forecast = await _service().get_forecast(hours)
+        return orjson.dumps(forecast).decode()
     except Exception as e:
         logger.error(f"Error getting forecast: {e}")
-        return json.dumps({"error": str(e)})
+        return orjson.dumps({"error": str(e)}).decode()
 
 
 @tool(name="is_storm_incoming", description="Assess whether a storm is incoming based on current weather conditions")
 async def is_storm_incoming() -> str:
     try:
-        assessment = await _weather_service.is_storm_incoming()
-        return json.dumps(assessment, indent=2)
+        assessment = await _service().is_storm_incoming()
+        return orjson.dumps(assessment).decode()
     except Exception as e:
         logger.error(f"Error assessing storm conditions: {e}")
-        return json.dumps({"error": str(e)})
+        return orjson.dumps({"error": str(e)}).decode()
+
+
+@tool(name="get_weather_summary", description="Get current conditions, an hourly forecast (1-24 hours ahead) and a storm assessment in a single call")
+async def get_weather_summary(
+    hours: Annotated[int, Field(description="Number of hours to forecast, 1-24")] = 6,
+) -> str:
+    try:
+        # Fetch the conditions once and derive the forecast and storm
+        # assessment from them; neither needs another round-trip
+        service = _service()
+        conditions = await service.get_current_conditions()
+        forecast = await service.get_forecast(hours, conditions)
+        storm = await service.is_storm_incoming(conditions)
+        # Both results are built per call; the conditions are returned once
+        forecast.pop("current_conditions", None)
+        storm.pop("current_conditions", None)
+        return orjson.dumps({"current": conditions, "forecast": forecast, "storm": storm}).decode()
+    except Exception as e:
+        logger.error(f"Error getting weather summary: {e}")
+        return orjson.dumps({"error": str(e)}).decode()
+
 
+async def aclose() -> None:
+    """Release the shared weather service's HTTP connections."""
+    global _weather_service
+    if _weather_service is not None:
+        await _weather_service.aclose()
+        _weather_service = None
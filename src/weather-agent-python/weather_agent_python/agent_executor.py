@@ -1,34 +1,65 @@
 """
 Weather Agent Executor for A2A SDK.
 """
+import asyncio
 import logging
-from typing import override
+import uuid
+from typing import Any, ClassVar, override
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
-from a2a.utils import new_agent_text_message
+from a2a.server.tasks import TaskUpdater
+from a2a.types import Part, TextPart
+from a2a.utils import new_agent_text_message, new_task
 
 from agent_framework.azure import AzureOpenAIChatClient
-from azure.identity import AzureCliCredential
+from azure.identity.aio import DefaultAzureCredential
 
-from tools.weather_tools import get_current_conditions, get_forecast, is_storm_incoming
+from tools import weather_tools
+from tools.weather_tools import get_current_conditions, get_forecast, is_storm_incoming, get_weather_summary
 
 logger = logging.getLogger(__name__)
 
+# One credential per process, so its token cache is shared by every agent.
+# The async credential refreshes tokens without blocking the event loop and
+# resolves to managed identity when deployed or the Azure CLI login locally.
+_credential = DefaultAzureCredential()
 
-class WeatherAgentExecutor(AgentExecutor):
-
-    def __init__(self):
-        self.agent = AzureOpenAIChatClient(credential=AzureCliCredential()).as_agent(
-            name="weather-agent",
-            instructions="""You are the Weather Intelligence Agent for AlpineAI ski resort. 
+_INSTRUCTIONS = """You are the Weather Intelligence Agent for AlpineAI ski resort. 
 Your role is to help skiers, staff, and resort operators understand current weather conditions, 
 upcoming forecasts, and potential storm threats.
 
 When users ask questions, always provide specific numbers and actionable recommendations.
-Be concise but thorough. Safety is the top priority.""",
-            tools=[get_current_conditions, get_forecast, is_storm_incoming],
-        )
+Be concise but thorough. Safety is the top priority."""
+
+
+class WeatherAgentExecutor(AgentExecutor):
+
+    # Built on first use and shared by every executor instance
+    _agent_singleton: ClassVar[Any] = None
+    _agent_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
+    async def _get_agent(self) -> Any:
+        """Return the shared weather agent, building it on first use."""
+        cls = type(self)
+        if cls._agent_singleton is None:
+            async with cls._agent_lock:
+                if cls._agent_singleton is None:
+                    cls._agent_singleton = AzureOpenAIChatClient(credential=_credential).as_agent(
+                        name="weather-agent",
+                        instructions=_INSTRUCTIONS,
+                        tools=[get_current_conditions, get_forecast, is_storm_incoming, get_weather_summary],
+                    )
+        return cls._agent_singleton
+
+    def start(self) -> None:
+        """Set up resources held by the agent's tools in this worker process."""
+        weather_tools.start()
+
+    async def aclose(self) -> None:
+        """Release resources held by the agent's tools and the credential."""
+        await weather_tools.aclose()
+        await _credential.close()
 
     @override
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
@@ -36,12 +67,39 @@ Be concise but thorough. Safety is the top priority.""",
         if not context.message:
             raise Exception('No message provided')
 
+        task = context.current_task
+        if task is None:
+            task = new_task(context.message)
+            await event_queue.enqueue_event(task)
+        updater = TaskUpdater(event_queue, task.id, task.context_id)
+
         try:
-            response = await self.agent.run(query)
-            await event_queue.enqueue_event(new_agent_text_message(response.text))
+            agent = await self._get_agent()
+            await updater.start_work()
+            # Text deltas are appended to one response artifact as the model
+            # produces them. One delta is held back so the final chunk carries
+            # text rather than an empty part.
+            artifact_id = str(uuid.uuid4())
+            append = False
+            pending = ""
+            async for update in agent.run(query, stream=True):
+                if not update.text:
+                    continue
+                if pending:
+                    await updater.add_artifact(
+                        [Part(root=TextPart(text=pending))],
+                        artifact_id=artifact_id, name="response", append=append, last_chunk=False,
+                    )
+                    append = True
+                pending = update.text
+            await updater.add_artifact(
+                [Part(root=TextPart(text=pending))],
+                artifact_id=artifact_id, name="response", append=append, last_chunk=True,
+            )
+            await updater.complete()
         except Exception as e:
             logger.error(f"Error during execution: {e}", exc_info=True)
-            await event_queue.enqueue_event(new_agent_text_message(f"Error: {str(e)}"))
+            await updater.failed(new_agent_text_message(f"Error: {str(e)}", task.context_id, task.id))
 
     @override
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
@@ -4,6 +4,8 @@ Uses the official A2A Python SDK with FastAPI and JSON-RPC support.
 """
 import os
 import logging
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
 import uvicorn
 
@@ -23,6 +25,7 @@ from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBasedTraceIdRatio
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
 # Microsoft Agent Framework
@@ -34,9 +37,21 @@ from .agent_executor import WeatherAgentExecutor
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Static parts of the agent card
+_SKILL_EXAMPLES = (
+    "What are current weather conditions?",
+    "Give me a 6 hour forecast",
+    "Is there a storm coming?",
+    "What's the temperature and wind speed?",
+    "Should we expect snow in the next 12 hours?",
+    "Is it safe to keep the upper lifts open?",
+)
+_SKILL_TAGS = ("weather", "forecast", "storm", "conditions", "safety")
+
 
+@lru_cache(maxsize=4)
 def get_agent_card(host: str, port: int) -> AgentCard:
-    """Create and return the AgentCard for the weather agent."""
+    """Create and return the AgentCard for the weather agent, built once per (host, port)."""
     return AgentCard(
         name="weather-agent",
         description="Weather intelligence agent providing real-time conditions, forecasts, and storm alerts for the ski resort",
@@ -54,15 +69,8 @@ def get_agent_card(host: str, port: int) -> AgentCard:
                 id="weather-intelligence",
                 name="Weather Intelligence",
                 description="Provides real-time weather conditions, forecasts, and storm alerts for the ski resort",
-                examples=[
-                    "What are current weather conditions?",
-                    "Give me a 6 hour forecast",
-                    "Is there a storm coming?",
-                    "What's the temperature and wind speed?",
-                    "Should we expect snow in the next 12 hours?",
-                    "Is it safe to keep the upper lifts open?"
-                ],
-                tags=["weather", "forecast", "storm", "conditions", "safety"]
+                examples=list(_SKILL_EXAMPLES),
+                tags=list(_SKILL_TAGS)
             )
         ]
     )
@@ -73,8 +81,6 @@ def create_app():
     port = int(os.environ.get("PORT", 8081))
     host = os.environ.get("HOST", "0.0.0.0")
 
-    configure_otel_providers()
-
     agent_card = get_agent_card(host, port)
     agent_executor = WeatherAgentExecutor()
     task_store = InMemoryTaskStore()
@@ -89,7 +95,14 @@ def create_app():
         http_handler=http_handler
     )
 
-    app_instance = server.build()
+    @asynccontextmanager
+    async def lifespan(app):
+        """Open the weather service on startup; close pooled HTTP connections on shutdown."""
+        agent_executor.start()
+        yield
+        await agent_executor.aclose()
+
+    app_instance = server.build(lifespan=lifespan)
 
     from fastapi.middleware.cors import CORSMiddleware
     app_instance.add_middleware(
@@ -106,16 +119,31 @@ def create_app():
 
     otel_endpoint = os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT")
     if otel_endpoint:
-        trace.set_tracer_provider(TracerProvider())
+        # Sample a share of new traces but always follow the caller's decision.
+        # The provider is installed before configure_otel_providers(), which
+        # would otherwise claim the global tracer provider first.
+        sample_ratio = float(os.environ.get("OTEL_SAMPLE_RATIO", "0.1"))
+        trace.set_tracer_provider(TracerProvider(sampler=ParentBasedTraceIdRatio(sample_ratio)))
         otlp_exporter = OTLPSpanExporter(endpoint=otel_endpoint)
-        processor = BatchSpanProcessor(otlp_exporter)
+        # Larger, less frequent batches keep export wakeups off the event loop
+        processor = BatchSpanProcessor(
+            otlp_exporter,
+            max_queue_size=2048,
+            schedule_delay_millis=10_000,
+            max_export_batch_size=256,
+            export_timeout_millis=5_000,
+        )
         trace.get_tracer_provider().add_span_processor(processor)
+        configure_otel_providers()
         FastAPIInstrumentor().instrument_app(app_instance)
 
     return app_instance
 
 
-app = create_app()
+# Built when imported by uvicorn; under "python -m" main() hands uvicorn the
+# import string, which imports this module again and builds the app there
+if __name__ != "__main__":
+    app = create_app()
 
 
 def main():
@@ -123,8 +151,20 @@ def main():
     port = int(os.environ.get("PORT", 8081))
     host = os.environ.get("HOST", "0.0.0.0")
 
-    logger.info(f"Weather Agent starting on http://{host}:{port}")
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # Task state lives in an in-memory store per process, so extra workers are opt-in
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+    logger.info(f"Weather Agent starting on http://{host}:{port} with {workers} worker(s)")
+    # Workers are spawned from the import string; uvloop is picked when installed
+    uvicorn.run(
+        "weather_agent_python.main:app",
+        host=host,
+        port=port,
+        log_level="info",
+        loop="auto",
+        http="httptools",
+        workers=workers,
+    )
 
 
 if __name__ == "__main__":